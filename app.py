@@ -1,14 +1,21 @@
 import streamlit as st
+import plotly.graph_objects as go
+import os
 import sys
 from pathlib import Path
 
-from src.extractors import ResumeExtractor
+from src.extractors import ResumeExtractor, MAX_TEXT_CHARS
 from src.nlp_processor import NLPProcessor
 from src.skill_predictor import SkillPredictor
-from src.job_matcher import JobMatcher
 from src.resume_scorer import ResumeScorer
 from src.career_predictor import CareerPredictor
-from utils.constants import SAMPLE_JOBS
+from src.result_store import ResultStore
+from src.catalog_manager import CatalogManager
+from src.profiling import AnalysisProfiler
+from src.dashboard_aggregates import SCORE_BINS
+from utils.constants import (
+    RESULT_STORE_PATH, PREVIEW_CHARS, JOB_CATALOG_PATH, PROFILE_DIR, PROFILE_CAPACITY
+)
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -23,8 +30,29 @@ if "resume_text" not in st.session_state:
     st.session_state.resume_text = None
 if "analysis_results" not in st.session_state:
     st.session_state.analysis_results = {}
+if "resume_preview" not in st.session_state:
+    st.session_state.resume_preview = None
 if "file_name" not in st.session_state:
     st.session_state.file_name = None
+if "upload_id" not in st.session_state:
+    st.session_state.upload_id = None
+
+
+@st.cache_resource
+def get_result_store():
+    return ResultStore(RESULT_STORE_PATH)
+
+
+@st.cache_resource
+def get_job_catalog():
+    return CatalogManager(JOB_CATALOG_PATH).start()
+
+
+@st.cache_resource
+def get_profiler():
+    sample_rate = float(os.environ.get("RESUME_PROFILE_SAMPLE_RATE", "0"))
+    return AnalysisProfiler(PROFILE_DIR, PROFILE_CAPACITY, sample_rate)
+
 
 st.markdown("""
 # 📄 Resume Intelligence System
@@ -36,6 +64,7 @@ with st.sidebar:
     st.header("⚙️ Configuration")
     analysis_type = st.radio("Analysis Type:", ["Full", "Quick", "Jobs"])
     show_recommendations = st.checkbox("Recommendations", value=True)
+    profile_analysis = st.checkbox("Profile analysis", value=False)
 
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "📤 Upload", "🔍 Analysis", "🎯 Jobs", "💼 Career", "📊 Dashboard"
@@ -58,18 +87,25 @@ with tab1:
             placeholder="Paste your resume here..."
         )
 
-    if uploaded_file:
+    # Reruns keep the same upload; only extract (and profile) a newly uploaded file
+    if uploaded_file and uploaded_file.file_id != st.session_state.upload_id:
         try:
             file_type = uploaded_file.name.split(".")[-1].lower()
-            with st.spinner("Extracting..."):
-                st.session_state.resume_text = ResumeExtractor.extract(uploaded_file, file_type)
-            st.success("✅ Extracted!")
+            with st.spinner("Extracting..."), get_profiler().profile(
+                uploaded_file.getvalue, label="extract", file_type=file_type, force=profile_analysis
+            ):
+                st.session_state.resume_text = ResumeExtractor.extract_upload(uploaded_file, file_type)
+            st.session_state.resume_preview = st.session_state.resume_text[:PREVIEW_CHARS]
             st.session_state.file_name = uploaded_file.name
+            st.session_state.upload_id = uploaded_file.file_id
         except Exception as e:
             st.error(f"❌ {e}")
+    if uploaded_file and uploaded_file.file_id == st.session_state.upload_id:
+        st.success("✅ Extracted!")
 
     if pasted_text and not st.session_state.resume_text:
-        st.session_state.resume_text = pasted_text
+        st.session_state.resume_text = pasted_text[:MAX_TEXT_CHARS]
+        st.session_state.resume_preview = pasted_text[:PREVIEW_CHARS]
         st.session_state.file_name = "Pasted"
         st.success("✅ Loaded!")
 
@@ -77,7 +113,7 @@ with tab1:
         st.subheader("📄 Preview")
         st.text_area(
             label="Preview",
-            value=st.session_state.resume_text,
+            value=st.session_state.resume_preview,
             height=250,
             disabled=True
         )
@@ -87,7 +123,9 @@ with tab2:
     st.header("🔍 Analysis")
     if st.session_state.resume_text:
         if st.button("🚀 Analyze", type="primary"):
-            with st.spinner("Analyzing..."):
+            with st.spinner("Analyzing..."), get_profiler().profile(
+                st.session_state.resume_text, label="analysis", force=profile_analysis
+            ):
                 nlp = NLPProcessor()
                 
                 # Contact
@@ -130,12 +168,23 @@ with tab2:
                     st.write(f"• {p}")
 
                 # Store results
+                quality_score, _ = ResumeScorer.calculate_quality_score(st.session_state.resume_text)
                 st.session_state.analysis_results = {
                     "skills": skills_dict,
                     "skill_count": count,
                     "years_experience": years,
                     "projects": projects,
+                    "quality_score": quality_score,
                 }
+                job_fits = get_job_catalog().rank_jobs(
+                    st.session_state.resume_text, skills_dict
+                )
+                get_result_store().record(
+                    st.session_state.resume_text,
+                    st.session_state.analysis_results,
+                    job_fits=job_fits,
+                    file_name=st.session_state.file_name,
+                )
                 st.success("✅ Complete!")
     else:
         st.info("👆 Upload first")
@@ -144,10 +193,9 @@ with tab3:
     st.header("🎯 Job Matching")
     if st.session_state.analysis_results:
         try:
-            jobs = JobMatcher.rank_jobs(
+            jobs = get_job_catalog().rank_jobs(
                 st.session_state.resume_text,
                 st.session_state.analysis_results["skills"],
-                SAMPLE_JOBS
             )
             for i, job in enumerate(jobs[:6], 1):
                 with st.expander(f"#{i} {job['job_title']} ({job['fit_score']}%)"):
@@ -185,7 +233,47 @@ with tab5:
             st.metric("Experience", f"{results.get('years_experience', 0)}y")
         with col3:
             st.metric("Projects", len(results.get("projects", [])))
-        st.balloons()
+
+    # Cohort views read pre-aggregated stats, so cost does not grow with history
+    aggregates = get_result_store().aggregates
+    st.subheader(f"👥 All analyzed resumes ({aggregates.total})")
+    if aggregates.total:
+        bin_labels = [f"{i * 5}-{i * 5 + 5}" for i in range(SCORE_BINS)]
+        col1, col2 = st.columns(2)
+        with col1:
+            top_skills = aggregates.top_skills(20)
+            if top_skills:
+                fig = go.Figure(go.Bar(
+                    x=[c for _, c in top_skills][::-1], y=[s for s, _ in top_skills][::-1],
+                    orientation="h",
+                ))
+                fig.update_layout(title="Most common skills", height=500)
+                st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            fig = go.Figure(go.Bar(x=bin_labels, y=aggregates.quality_hist))
+            fig.update_layout(title="Quality score distribution", xaxis_title="Quality score")
+            st.plotly_chart(fig, use_container_width=True)
+
+        trend = aggregates.quality_trend()
+        if trend:
+            fig = go.Figure(go.Scatter(
+                x=[t["day"] for t in trend], y=[t["mean_quality"] for t in trend],
+                mode="lines+markers", text=[f"{t['count']} resumes" for t in trend],
+            ))
+            fig.update_layout(title="Mean quality score per day", yaxis_title="Quality score")
+            st.plotly_chart(fig, use_container_width=True)
+
+        job_titles = aggregates.job_titles()
+        if job_titles:
+            job_title = st.selectbox("Fit scores for job:", job_titles)
+            summary = aggregates.job_summary(job_title)
+            cols = st.columns(len(summary["percentiles"]) + 1)
+            cols[0].metric("Resumes", summary["count"])
+            for col, (q, value) in zip(cols[1:], summary["percentiles"].items()):
+                col.metric(f"p{int(q * 100)} fit", f"{value:.1f}%")
+            fig = go.Figure(go.Bar(x=bin_labels, y=summary["hist"]))
+            fig.update_layout(title=f"Fit score distribution: {job_title}", xaxis_title="Fit score")
+            st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("👆 Analyze first")
 
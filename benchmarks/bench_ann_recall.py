@@ -0,0 +1,83 @@
+"""Benchmark ANN job recommendations: recall@k and latency versus exact cosine"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.job_recommender import JobANNIndex, job_text  # noqa: E402
+from utils.constants import SAMPLE_JOBS  # noqa: E402
+
+K = 10
+QUERIES = 50
+N_PROBES = [1, 4, 8, 16, 32]
+
+
+def synthetic_postings(n_jobs: int, seed: int = 0, per_template: int = 20):
+    """Postings in families of near-duplicates, like one role at many companies."""
+    rng = random.Random(seed)
+    vocabulary = sorted({k for job in SAMPLE_JOBS for k in job["keywords"]})
+    filler = [f"term{i}" for i in range(5000)]
+    templates = [
+        {
+            "title": rng.choice(SAMPLE_JOBS)["title"],
+            "keywords": rng.sample(vocabulary, rng.randint(3, 8)),
+            "description": rng.choices(filler, k=30),
+        }
+        for _ in range(max(1, n_jobs // per_template))
+    ]
+    postings = []
+    for _ in range(n_jobs):
+        template = rng.choice(templates)
+        words = [w if rng.random() > 0.2 else rng.choice(filler) for w in template["description"]]
+        postings.append({**template, "description": " ".join(words)})
+    return postings
+
+
+def noisy_queries(jobs, n: int, seed: int = 1):
+    """Resume-like queries: a posting's text with words dropped and extra words added."""
+    rng = random.Random(seed)
+    queries = []
+    for job in rng.sample(jobs, n):
+        words = job_text(job).split()
+        kept = [w for w in words if rng.random() > 0.3]
+        queries.append(" ".join(kept + [f"term{rng.randrange(5000)}" for _ in range(10)]))
+    return queries
+
+
+def main(n_jobs: int = 50_000) -> None:
+    jobs = synthetic_postings(n_jobs)
+    queries = noisy_queries(jobs, QUERIES)
+
+    start = time.perf_counter()
+    index = JobANNIndex(jobs)
+    print(f"jobs {n_jobs}  lists {len(index.centroids)}  build {time.perf_counter() - start:.1f}s")
+
+    # Ground truth: exact cosine over the full hashed (unprojected) vectors
+    job_matrix = index.vectorizer.transform([job_text(j) for j in jobs])
+    truths, exact_ms = [], 0.0
+    for text in queries:
+        t0 = time.perf_counter()
+        scores = (job_matrix @ index.vectorizer.transform([text]).T).toarray().ravel()
+        truths.append(set(np.argsort(-scores)[:K]))
+        exact_ms += (time.perf_counter() - t0) * 1000
+    print(f"exact cosine: {exact_ms / QUERIES:.2f} ms/query")
+
+    for n_probe in N_PROBES:
+        ann_ms, recalls, scanned = 0.0, [], []
+        for text, truth in zip(queries, truths):
+            t0 = time.perf_counter()
+            found = {r["job_index"] for r in index.query(text, K, n_probe=n_probe)}
+            ann_ms += (time.perf_counter() - t0) * 1000
+            recalls.append(len(truth & found) / K)
+            scanned.append(len(index.candidates(index.embed([text])[0], n_probe)))
+        print(f"n_probe {n_probe:>3}  recall@{K} {np.mean(recalls):.2f}  "
+              f"{ann_ms / QUERIES:.2f} ms/query  scanned {np.mean(scanned):.0f} jobs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
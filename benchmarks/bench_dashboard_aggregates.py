@@ -0,0 +1,78 @@
+"""Benchmark pre-aggregated dashboard reads against SQL over the raw history"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.result_store import ResultStore  # noqa: E402
+
+SKILLS = ["python", "sql", "aws", "docker", "react", "java", "pytorch", "spark", "go", "excel"]
+JOBS = ["ML Engineer", "Data Scientist", "Backend Engineer", "Frontend Engineer", "Data Analyst"]
+
+
+def synthetic_items(n: int, rng):
+    for i in range(n):
+        skills = list(rng.choice(SKILLS, rng.integers(1, 6), replace=False))
+        yield {
+            "resume_text": f"resume {i}",
+            "results": {
+                "skills": {"Technical Skills": skills},
+                "skill_count": len(skills),
+                "years_experience": int(rng.integers(0, 25)),
+                "quality_score": float(np.clip(rng.normal(65, 15), 0, 100)),
+            },
+            "job_fits": [{"job_title": j, "fit_score": round(float(rng.beta(2, 5) * 100), 1)}
+                         for j in JOBS],
+        }
+
+
+def main(n: int = 100_000) -> None:
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultStore(str(Path(tmp) / "bench.db"))
+        start = time.perf_counter()
+        store.record_many(synthetic_items(n, rng))
+        print(f"analyses:        {n}  (record_many {time.perf_counter() - start:.1f}s incl. aggregates)")
+
+        start = time.perf_counter()
+        agg = store.aggregates
+        agg.top_skills(20)
+        summaries = {j: agg.job_summary(j) for j in agg.job_titles()}
+        agg.quality_trend()
+        pre = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store.conn.execute(
+            "SELECT skill, COUNT(*) c FROM analysis_skills GROUP BY skill ORDER BY c DESC LIMIT 20"
+        ).fetchall()
+        exact = {}
+        for job in JOBS:
+            scores = np.array([r[0] for r in store.conn.execute(
+                "SELECT fit_score FROM job_fits WHERE job_title = ?", (job,))])
+            exact[job] = np.percentile(scores, [50, 75, 90])
+        store.conn.execute(
+            "SELECT date(created_at, 'unixepoch'), COUNT(*), AVG(quality_score) FROM analyses GROUP BY 1"
+        ).fetchall()
+        raw = time.perf_counter() - start
+
+        print(f"aggregate read:  {pre * 1000:.2f} ms")
+        print(f"raw SQL read:    {raw * 1000:.2f} ms")
+        worst = max(abs(summaries[j]["percentiles"][q] - exact[j][i])
+                    for j in JOBS for i, q in enumerate((0.5, 0.75, 0.9)))
+        print(f"max percentile error (sketch vs exact): {worst:.3f} points")
+
+        start = time.perf_counter()
+        reopened = ResultStore(str(Path(tmp) / "bench.db"))
+        print(f"reopen + load:   {(time.perf_counter() - start) * 1000:.2f} ms "
+              f"(total={reopened.aggregates.total})")
+        reopened.close()
+        store.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,40 @@
+"""Benchmark vectorized market-value estimation over a large candidate pool"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.career_predictor import CareerPredictor  # noqa: E402
+
+TITLES = ["Senior ML Engineer", "Data Scientist", "Software Engineer", "Tech Lead", "Barista"]
+
+
+def main(n: int = 100_000) -> None:
+    rng = np.random.default_rng(0)
+    years = rng.integers(0, 20, n)
+    skills = rng.integers(0, 25, n)
+    titles = rng.choice(TITLES, n)
+
+    CareerPredictor.estimate_market_value_batch(years[:10], skills[:10], titles=titles[:10])
+
+    start = time.perf_counter()
+    result = CareerPredictor.estimate_market_value_batch(years, skills, titles=titles)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(n):
+        CareerPredictor.estimate_market_value([titles[i]], int(years[i]), int(skills[i]))
+    loop = time.perf_counter() - start
+
+    print(f"candidates:      {n}")
+    print(f"batch estimate:  {batch * 1000:.1f} ms")
+    print(f"per-resume loop: {loop * 1000:.1f} ms")
+    print(f"median p50:      ${np.median(result['p50']):.0f}k")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,62 @@
+"""Benchmark translate-table cleaning and early-exit contact extraction on ~1 MB inputs"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.normalization import clean_text, extract_contact  # noqa: E402
+
+WORDS = ["Python", "engineer", "built", "pipelines", "2019-2021", "C++", "(AWS)", "→", "•",
+         "résumé", "team@corp.io", "#1", "100%", "data/ML", "\t", "\n", "  ", "led", "id:48213377"]
+HEADER = "Jane Doe | jane.doe@example.com | +1 (555) 123-4567 | linkedin.com/in/janedoe\n"
+
+
+def old_clean(text: str) -> str:
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^a-zA-Z0-9\s\.\-+()@]', ' ', text)
+    text = re.sub(r' +', ' ', text)
+    return text.strip()
+
+
+def old_contact(text: str) -> dict:
+    emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    phones = re.findall(r'[\+]?[1-9][\d]{7,15}', text)
+    return {'email': emails[0] if emails else None, 'phone': phones[0] if phones else None}
+
+
+def sample_text(size: int) -> str:
+    rng = random.Random(0)
+    parts, total = [HEADER], len(HEADER)
+    while total < size:
+        word = rng.choice(WORDS)
+        parts.append(word + " ")
+        total += len(word) + 1
+    return "".join(parts)
+
+
+def timed(fn, text: str, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(size: int = 1024 * 1024) -> None:
+    text = sample_text(size)
+    assert clean_text(text) == old_clean(text)
+    mb = len(text) / 1e6
+    for name, old, new in [("clean", old_clean, clean_text), ("contact", old_contact, extract_contact)]:
+        t_old, t_new = timed(old, text), timed(new, text)
+        print(f"{name:<8} regex: {t_old * 1000:7.2f} ms ({mb / t_old:6.1f} MB/s)   "
+              f"new: {t_new * 1000:7.2f} ms ({mb / t_new:6.1f} MB/s)   x{t_old / t_new:.1f}")
+    print(f"contact: {extract_contact(text)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1024 * 1024)
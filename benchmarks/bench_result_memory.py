@@ -0,0 +1,56 @@
+"""Benchmark memory of slotted/array batch results versus rank_jobs dict output"""
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_sharded_matcher import synthetic_catalog  # noqa: E402
+from src.job_matcher import JobMatcher  # noqa: E402
+from src.nlp_processor import NLPProcessor  # noqa: E402
+from src.results import AnalysisResult, CompactCatalog, SkillSet  # noqa: E402
+
+
+def measure(build):
+    """Bytes still allocated by the object ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main(n_resumes: int = 1000, n_jobs: int = 300) -> None:
+    resume = (Path(__file__).resolve().parent.parent / "data" / "sample_resumes" / "sample1.txt").read_text()
+    skills_dict, count = NLPProcessor().extract_skills(resume)
+    jobs = synthetic_catalog(n_jobs)
+    catalog = CompactCatalog(jobs)
+    # Distinct texts per resume so nothing is shared between results
+    texts = [f"{resume}\nref {i}" for i in range(n_resumes)]
+
+    dict_results, dict_bytes = measure(
+        lambda: [JobMatcher.rank_jobs(t, skills_dict, jobs) for t in texts]
+    )
+
+    def compact():
+        out = []
+        for i, t in enumerate(texts):
+            skills = SkillSet.from_skills_dict(skills_dict, count, catalog.vocab)
+            out.append(AnalysisResult(str(i), skills, 5, 80.0, catalog.rank(t, skills)))
+        return out
+
+    compact_results, compact_bytes = measure(compact)
+
+    assert compact_results[0].scores.top(catalog, 5) == dict_results[0][:5]
+    print(f"{n_resumes} resumes x {n_jobs} jobs")
+    print(f"dict output:    {dict_bytes / 1e6:8.1f} MB  ({dict_bytes / n_resumes / 1024:.1f} KB/resume)")
+    print(f"compact output: {compact_bytes / 1e6:8.1f} MB  ({compact_bytes / n_resumes / 1024:.1f} KB/resume)")
+    print(f"reduction:      {dict_bytes / max(compact_bytes, 1):8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
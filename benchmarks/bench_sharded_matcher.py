@@ -0,0 +1,52 @@
+"""Benchmark scatter-gather ranking latency versus shard count"""
+
+import random
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.nlp_processor import NLPProcessor  # noqa: E402
+from src.sharded_matcher import ShardedJobIndex  # noqa: E402
+from utils.constants import SAMPLE_JOBS  # noqa: E402
+
+SHARD_COUNTS = [1, 2, 4, 8]
+QUERIES = 20
+
+
+def synthetic_catalog(n_jobs: int, seed: int = 0):
+    """Catalog of n_jobs postings drawn from the sample job vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = sorted({k for job in SAMPLE_JOBS for k in job["keywords"]})
+    titles = [job["title"] for job in SAMPLE_JOBS]
+    return [
+        {"id": i, "title": rng.choice(titles), "keywords": rng.sample(vocabulary, rng.randint(3, 10))}
+        for i in range(n_jobs)
+    ]
+
+
+def main(n_jobs: int = 50_000) -> None:
+    resume = (Path(__file__).resolve().parent.parent / "data" / "sample_resumes" / "sample1.txt").read_text()
+    skills, _ = NLPProcessor().extract_skills(resume)
+    jobs = synthetic_catalog(n_jobs)
+
+    print(f"catalog: {n_jobs} jobs, {QUERIES} queries per configuration")
+    print(f"{'shards':>6}  {'p50 ms':>8}  {'p95 ms':>8}  {'max shard ms':>12}  {'max rtt ms':>10}")
+    for n_shards in SHARD_COUNTS:
+        with ShardedJobIndex(jobs, n_shards=n_shards, timeout=30.0) as index:
+            index.rank(resume, skills)
+            latencies, slowest, round_trips = [], [], []
+            for _ in range(QUERIES):
+                result = index.rank(resume, skills, k=10)
+                latencies.append(result["latency_ms"])
+                slowest.append(max(t["compute_ms"] for t in result["shard_timings"].values()))
+                round_trips.append(max(t["round_trip_ms"] for t in result["shard_timings"].values()))
+        latencies.sort()
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        print(f"{n_shards:>6}  {statistics.median(latencies):>8.1f}  {p95:>8.1f}  "
+              f"{statistics.median(slowest):>12.1f}  {statistics.median(round_trips):>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -9,6 +9,19 @@ from .skill_predictor import SkillPredictor
 from .job_matcher import JobMatcher
 from .resume_scorer import ResumeScorer
 from .career_predictor import CareerPredictor
+from .result_store import ResultStore
+from .pipeline import IngestionPipeline
+from .title_taxonomy import TitleTaxonomy
+from .market_value import SalaryTable
+from .fuzzy_matcher import FuzzyMatcher
+from .sharded_matcher import ShardedJobIndex
+from .catalog_manager import CatalogManager
+from .skill_gap import SkillGapAnalytics
+from .job_recommender import JobANNIndex
+from .results import Vocabulary, SkillSet, CompactCatalog, JobScores, AnalysisResult
+from .worker_pool import WarmWorkerPool
+from .profiling import AnalysisProfiler
+from .dashboard_aggregates import DashboardAggregates, ScoreSketch
 
 __all__ = [
     "ResumeExtractor",
@@ -17,5 +30,23 @@ __all__ = [
     "SkillPredictor",
     "JobMatcher",
     "ResumeScorer",
-    "CareerPredictor"
+    "CareerPredictor",
+    "ResultStore",
+    "IngestionPipeline",
+    "TitleTaxonomy",
+    "SalaryTable",
+    "FuzzyMatcher",
+    "ShardedJobIndex",
+    "CatalogManager",
+    "SkillGapAnalytics",
+    "JobANNIndex",
+    "Vocabulary",
+    "SkillSet",
+    "CompactCatalog",
+    "JobScores",
+    "AnalysisResult",
+    "WarmWorkerPool",
+    "AnalysisProfiler",
+    "DashboardAggregates",
+    "ScoreSketch",
 ]
@@ -1,7 +1,11 @@
 """Predict career trajectory and growth recommendations"""
 
-from typing import Dict, List, Tuple
-import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .market_value import get_salary_table
+from .title_taxonomy import get_taxonomy
 
 
 class CareerPredictor:
@@ -29,32 +33,13 @@ class CareerPredictor:
 
     @staticmethod
     def extract_job_titles(resume_text: str) -> List[str]:
-        """Very simple heuristic job-title extractor from resume text."""
-        job_titles: List[str] = []
-        # Look for common role keywords
-        patterns = [
-            r"(Junior\s+Developer)",
-            r"(Senior\s+Developer)",
-            r"(Data\s+Scientist)",
-            r"(ML\s+Engineer)",
-            r"(Machine\s+Learning\s+Engineer)",
-            r"(Software\s+Engineer)",
-            r"(Backend\s+Developer)",
-            r"(Frontend\s+Developer)",
-            r"(Full\s*Stack\s+Developer)",
-            r"(Engineering\s+Manager)",
-            r"(Tech\s+Lead)",
-            r"(Architect)",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, resume_text, re.IGNORECASE)
-            for match in matches:
-                title = match.group(0).strip()
-                if title not in job_titles:
-                    job_titles.append(title)
-
-        return job_titles[:5]
+        """Extract canonical job titles from resume text using the title taxonomy."""
+        return get_taxonomy().extract(resume_text, limit=5)
+
+    @staticmethod
+    def extract_job_titles_batch(resume_texts: List[str]) -> List[List[str]]:
+        """Extract job titles for many resumes with one compiled taxonomy."""
+        return get_taxonomy().extract_batch(resume_texts, limit=5)
 
     @staticmethod
     def predict_trajectory(job_titles: List[str], years_experience: int) -> Dict:
@@ -68,16 +53,13 @@ class CareerPredictor:
         if not job_titles:
             return trajectory
 
-        # Try to map detected title to one of our progression templates
+        # Map the first detected title with a known progression template
+        taxonomy = get_taxonomy()
         best_match = None
-        normalized_titles = [t.lower() for t in job_titles]
-
-        for prog_title in CareerPredictor.TECH_PROGRESSIONS.keys():
-            for resume_title in normalized_titles:
-                if prog_title.lower().split()[0] in resume_title:
-                    best_match = prog_title
-                    break
-            if best_match:
+        for title in job_titles:
+            progression_key = taxonomy.progression_for(title)
+            if progression_key in CareerPredictor.TECH_PROGRESSIONS:
+                best_match = progression_key
                 break
 
         # Fallbacks if nothing matches
@@ -140,6 +122,19 @@ class CareerPredictor:
             "currency": "USD",
         }
 
+    @staticmethod
+    def estimate_market_value_batch(
+        years_experience: Sequence[float],
+        skills_count: Sequence[int],
+        levels: Optional[Sequence[str]] = None,
+        titles: Optional[Sequence[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized market value for a candidate pool from the salary percentile table.
+
+        Returns arrays of level and p25/p50/p75 salary in $k, one entry per candidate.
+        """
+        return get_salary_table().estimate(years_experience, skills_count, levels, titles)
+
     @staticmethod
     def get_growth_recommendations(
         trajectory: Dict, skills: Dict[str, list]
@@ -0,0 +1,158 @@
+"""
+Job Catalog Manager - watches the catalog file and hot-swaps versioned snapshots
+Rebuilds run in the background; readers pin the snapshot they started with
+"""
+
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .fuzzy_matcher import FuzzyMatcher, tokenize
+from .job_matcher import JobMatcher
+
+
+class CatalogSnapshot:
+    """Immutable job catalog version with its prebuilt keyword index."""
+
+    def __init__(self, version: int, jobs: List[Dict], digest: str):
+        self.version = version
+        self.jobs = jobs
+        self.digest = digest
+        self.built_at = time.time()
+        keywords = JobMatcher.catalog_keywords(jobs)
+        self.matcher = FuzzyMatcher({k: k for k in keywords})
+
+    def rank_jobs(self, resume_text: str, skills_dict: dict) -> List[Dict]:
+        """Same ranking as JobMatcher.rank_jobs, against this snapshot only."""
+        resume_skills = JobMatcher.resume_skill_list(skills_dict)
+        found = set(self.matcher.find_tokens(tokenize(resume_text))) | set(resume_skills)
+        results = [JobMatcher.score_job(job, found, resume_skills) for job in self.jobs]
+        return sorted(results, key=lambda x: x['fit_score'], reverse=True)
+
+
+def load_catalog(path) -> List[Dict]:
+    """Read jobs from a catalog JSON file ({"jobs": [...]} or a bare list)."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    jobs = data.get("jobs") if isinstance(data, dict) else data
+    if not isinstance(jobs, list):
+        raise ValueError(f"Invalid job catalog: {path}: expected a list of jobs")
+    for i, job in enumerate(jobs):
+        if (not isinstance(job, dict) or not isinstance(job.get("title"), str)
+                or not isinstance(job.get("keywords", []), list)
+                or not all(isinstance(k, str) for k in job.get("keywords", []))):
+            raise ValueError(f"Invalid job catalog: {path}: job {i} needs a title and a keywords list")
+    return jobs
+
+
+class CatalogManager:
+    """Double-buffered job catalog: rebuild off to the side, then swap atomically.
+
+    ``current()`` returns the active snapshot; callers hold on to it for the
+    whole request, so a swap mid-request never mixes versions. Replaced
+    snapshots are not retained and are freed once their last reader finishes.
+    """
+
+    def __init__(self, path, poll_interval: float = 2.0):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.rebuild_durations = deque(maxlen=100)
+        self.rebuild_count = 0
+        self.rebuild_errors = 0
+        self.last_error: Optional[str] = None
+        self._live = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stat = self._file_stat()
+        self._snapshot = self._build(load_catalog(self.path), version=1)
+
+    def _file_stat(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _build(self, jobs: List[Dict], version: int) -> CatalogSnapshot:
+        started = time.perf_counter()
+        digest = hashlib.sha256(json.dumps(jobs, sort_keys=True).encode("utf-8")).hexdigest()
+        snapshot = CatalogSnapshot(version, jobs, digest)
+        self.rebuild_durations.append(time.perf_counter() - started)
+        self.rebuild_count += 1
+        self._live.add(snapshot)
+        return snapshot
+
+    def current(self) -> CatalogSnapshot:
+        """Active snapshot; a plain reference read, never blocked by rebuilds."""
+        return self._snapshot
+
+    def rank_jobs(self, resume_text: str, skills_dict: dict) -> List[Dict]:
+        """Rank against whichever snapshot is active when the call starts."""
+        return self.current().rank_jobs(resume_text, skills_dict)
+
+    def reload(self) -> bool:
+        """Rebuild from the catalog file and swap it in; True if the version changed.
+
+        A file that fails to load or build keeps the previous snapshot active.
+        """
+        with self._lock:
+            old = self._snapshot
+            try:
+                jobs = load_catalog(self.path)
+                digest = hashlib.sha256(json.dumps(jobs, sort_keys=True).encode("utf-8")).hexdigest()
+                if digest == old.digest:
+                    return False
+                new = self._build(jobs, old.version + 1)
+            except Exception as e:
+                self._record_error(e)
+                return False
+            # Reference assignment is atomic: readers see either old or new
+            self._snapshot = new
+            return True
+
+    def _record_error(self, error: Exception) -> None:
+        self.rebuild_errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+
+    def _watch(self) -> None:
+        # Never let one bad file end the watcher; later edits must still load
+        while not self._stop.wait(self.poll_interval):
+            try:
+                stat = self._file_stat()
+                if stat is not None and stat != self._stat:
+                    self._stat = stat
+                    self.reload()
+            except Exception as e:
+                self._record_error(e)
+
+    def start(self) -> "CatalogManager":
+        """Start the background watcher thread (idempotent)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="catalog-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def metrics(self) -> Dict:
+        durations = list(self.rebuild_durations)
+        return {
+            "version": self._snapshot.version,
+            "jobs": len(self._snapshot.jobs),
+            "rebuilds": self.rebuild_count,
+            "rebuild_errors": self.rebuild_errors,
+            "last_error": self.last_error,
+            "last_rebuild_ms": round(durations[-1] * 1000, 2) if durations else None,
+            "max_rebuild_ms": round(max(durations) * 1000, 2) if durations else None,
+            "live_snapshots": len(self._live),
+        }
@@ -0,0 +1,289 @@
+"""
+Dashboard Aggregates - incrementally maintained cohort statistics
+Histograms, per-skill counts and per-job score sketches, updated as analyses are stored
+"""
+
+import json
+import math
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dashboard_aggregates (
+    name TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+"""
+
+SCORE_BINS = 20          # 0-100 in steps of 5
+MAX_YEARS_BIN = 40       # years_experience histogram, last bin is "40+"
+TREND_DAYS = 365         # daily quality buckets kept for the trend line
+
+
+class ScoreSketch:
+    """Exact percentiles for 0-100 scores stored at 0.1-point resolution.
+
+    Fit scores are rounded to one decimal, so 1001 counters hold the whole
+    distribution in constant space; unlike a t-digest, values can also be
+    removed, which keeps re-recorded analyses from skewing the percentiles.
+    """
+
+    BUCKETS = 1001
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+
+    @classmethod
+    def _bucket(cls, value: float) -> int:
+        return min(max(int(round(float(value) * 10)), 0), cls.BUCKETS - 1)
+
+    def add(self, value: float) -> None:
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+
+    def remove(self, value: float) -> None:
+        bucket = self._bucket(value)
+        if self.counts[bucket]:
+            self.counts[bucket] -= 1
+            self.count -= 1
+
+    def hist(self, bins: int) -> List[int]:
+        """Counts folded into ``bins`` equal-width 0-100 bins."""
+        out = [0] * bins
+        for bucket, c in enumerate(self.counts):
+            if c:
+                out[score_bin(bucket / 10)] += c
+        return out
+
+    def _value_at(self, rank: int) -> float:
+        cumulative = 0
+        for bucket, c in enumerate(self.counts):
+            cumulative += c
+            if cumulative > rank:
+                return bucket / 10
+        return (self.BUCKETS - 1) / 10
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile q in [0, 1] (linear interpolation, as numpy), or None if empty."""
+        if not self.count:
+            return None
+        pos = q * (self.count - 1)
+        lo = int(math.floor(pos))
+        low = self._value_at(lo)
+        if pos == lo:
+            return low
+        return low + (pos - lo) * (self._value_at(lo + 1) - low)
+
+    def to_dict(self) -> Dict:
+        return {str(b): c for b, c in enumerate(self.counts) if c}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ScoreSketch":
+        sketch = cls()
+        for bucket, c in data.items():
+            sketch.counts[int(bucket)] = c
+            sketch.count += c
+        return sketch
+
+
+def score_bin(score: float) -> int:
+    """Histogram bin for a 0-100 score."""
+    return min(max(int(score // (100 / SCORE_BINS)), 0), SCORE_BINS - 1)
+
+
+class DashboardAggregates:
+    """Cohort statistics over every stored analysis, updated incrementally.
+
+    Re-recording an analysis (same content hash) replaces it: the stored
+    row's contribution is removed before the new one is added, so the
+    aggregates always equal a rebuild from the tables.
+    Reads are O(#bins + #skills + #jobs), independent of history size.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.quality_hist = [0] * SCORE_BINS
+        self.years_hist = [0] * (MAX_YEARS_BIN + 1)
+        self.skill_counts: Counter = Counter()
+        self.job_sketches: Dict[str, ScoreSketch] = {}
+        # "YYYY-MM-DD" -> [count, quality_sum]
+        self.quality_daily: Dict[str, List[float]] = {}
+        self._day_cache = (0.0, 0.0, "")
+        self._lock = threading.Lock()
+
+    def add(self, created_at: float, years_experience: int, quality_score: Optional[float],
+            skills: Iterable[str], job_fits: Iterable[Tuple[str, float]]) -> None:
+        """Fold one new analysis into the aggregates."""
+        with self._lock:
+            self._add(created_at, years_experience, quality_score, skills, job_fits)
+
+    def replace_rows(self, old_rows, new_rows) -> None:
+        """Swap stored rows for their replacements.
+
+        Both are ResultStore-flattened ``(key, analysis_row, skill_rows, fit_rows)``;
+        ``old_rows`` are the rows currently stored under the keys being written.
+        """
+        with self._lock:
+            for rows, fold in ((old_rows, self._remove), (new_rows, self._add)):
+                for _, analysis_row, skill_rows, fit_rows in rows:
+                    fold(
+                        analysis_row[2], analysis_row[4], analysis_row[5],
+                        [s for _, s in skill_rows],
+                        [(title, score) for _, title, score in fit_rows],
+                    )
+
+    def _day(self, created_at: float) -> str:
+        """Local calendar day, reusing the last result while inside the same day."""
+        start, end, day = self._day_cache
+        if not start <= created_at < end:
+            local = time.localtime(created_at)
+            day = time.strftime("%Y-%m-%d", local)
+            start = time.mktime(local[:3] + (0, 0, 0, 0, 0, -1))
+            end = time.mktime(local[:2] + (local[2] + 1, 0, 0, 0, 0, 0, -1))
+            self._day_cache = (start, end, day)
+        return day
+
+    def _add(self, created_at, years_experience, quality_score, skills, job_fits) -> None:
+        self.total += 1
+        self.years_hist[min(max(int(years_experience), 0), MAX_YEARS_BIN)] += 1
+        if quality_score is not None:
+            self.quality_hist[score_bin(quality_score)] += 1
+            bucket = self.quality_daily.setdefault(self._day(created_at), [0, 0.0])
+            bucket[0] += 1
+            bucket[1] += float(quality_score)
+            if len(self.quality_daily) > TREND_DAYS:
+                del self.quality_daily[min(self.quality_daily)]
+        self.skill_counts.update(skills)
+        for job_title, fit_score in job_fits:
+            sketch = self.job_sketches.get(job_title)
+            if sketch is None:
+                sketch = self.job_sketches[job_title] = ScoreSketch()
+            sketch.add(fit_score)
+
+    def _remove(self, created_at, years_experience, quality_score, skills, job_fits) -> None:
+        """Undo one earlier ``_add`` with the same arguments."""
+        self.total -= 1
+        self.years_hist[min(max(int(years_experience), 0), MAX_YEARS_BIN)] -= 1
+        if quality_score is not None:
+            self.quality_hist[score_bin(quality_score)] -= 1
+            day = self._day(created_at)
+            bucket = self.quality_daily.get(day)
+            # Days already rolled out of the trend window have nothing to undo
+            if bucket is not None:
+                bucket[0] -= 1
+                bucket[1] -= float(quality_score)
+                if bucket[0] <= 0:
+                    del self.quality_daily[day]
+        for skill in skills:
+            self.skill_counts[skill] -= 1
+            if self.skill_counts[skill] <= 0:
+                del self.skill_counts[skill]
+        for job_title, fit_score in job_fits:
+            sketch = self.job_sketches.get(job_title)
+            if sketch is not None:
+                sketch.remove(fit_score)
+                if not sketch.count:
+                    del self.job_sketches[job_title]
+
+    def top_skills(self, n: int = 20) -> List[Tuple[str, int]]:
+        with self._lock:
+            return self.skill_counts.most_common(n)
+
+    def job_titles(self) -> List[str]:
+        with self._lock:
+            return sorted(self.job_sketches)
+
+    def job_summary(self, job_title: str, quantiles=(0.5, 0.75, 0.9)) -> Optional[Dict]:
+        """Fit-score histogram and percentiles for one job."""
+        with self._lock:
+            sketch = self.job_sketches.get(job_title)
+            if sketch is None:
+                return None
+            return {
+                "hist": sketch.hist(SCORE_BINS),
+                "count": sketch.count,
+                "percentiles": {q: sketch.quantile(q) for q in quantiles},
+            }
+
+    def quality_trend(self) -> List[Dict]:
+        """Daily analysis count and mean quality score, oldest first."""
+        with self._lock:
+            return [{"day": day, "count": int(c), "mean_quality": s / c}
+                    for day, (c, s) in sorted(self.quality_daily.items()) if c]
+
+    def to_json(self) -> str:
+        with self._lock:
+            return json.dumps({
+                "total": self.total,
+                "quality_hist": self.quality_hist,
+                "years_hist": self.years_hist,
+                "skill_counts": dict(self.skill_counts),
+                "job_sketches": {k: s.to_dict() for k, s in self.job_sketches.items()},
+                "quality_daily": self.quality_daily,
+            })
+
+    @classmethod
+    def from_json(cls, payload: str) -> Optional["DashboardAggregates"]:
+        """The snapshot, or None if it predates the current format (rebuild it)."""
+        data = json.loads(payload)
+        if "job_sketches" not in data:
+            return None
+        agg = cls()
+        agg.total = data["total"]
+        agg.quality_hist = data["quality_hist"]
+        agg.years_hist = data["years_hist"]
+        agg.skill_counts = Counter(data["skill_counts"])
+        agg.job_sketches = {k: ScoreSketch.from_dict(d) for k, d in data["job_sketches"].items()}
+        agg.quality_daily = data["quality_daily"]
+        return agg
+
+    def save(self, conn) -> None:
+        """Persist the snapshot; call inside the transaction that stored the rows."""
+        conn.execute(
+            "INSERT OR REPLACE INTO dashboard_aggregates VALUES ('dashboard', ?)", (self.to_json(),)
+        )
+
+    @classmethod
+    def read(cls, conn) -> Optional["DashboardAggregates"]:
+        """The persisted snapshot, or None if there is none yet (or it is outdated)."""
+        row = conn.execute(
+            "SELECT payload FROM dashboard_aggregates WHERE name = 'dashboard'"
+        ).fetchone()
+        return cls.from_json(row[0]) if row else None
+
+    @classmethod
+    def load(cls, conn) -> "DashboardAggregates":
+        """Load the persisted snapshot, rebuilding it from stored rows if missing."""
+        conn.executescript(SCHEMA)
+        agg = cls.read(conn)
+        if agg is None:
+            with conn:
+                # Another process may have built it while we waited for the lock
+                conn.execute("BEGIN IMMEDIATE")
+                agg = cls.read(conn)
+                if agg is None:
+                    agg = cls.rebuild(conn)
+                    agg.save(conn)
+        return agg
+
+    @classmethod
+    def rebuild(cls, conn) -> "DashboardAggregates":
+        """One pass over the stored tables (used once for pre-existing databases)."""
+        agg = cls()
+        skills: Dict[str, List[str]] = {}
+        for key, skill in conn.execute("SELECT content_hash, skill FROM analysis_skills"):
+            skills.setdefault(key, []).append(skill)
+        fits: Dict[str, List[Tuple[str, float]]] = {}
+        for key, title, score in conn.execute(
+            "SELECT content_hash, job_title, fit_score FROM job_fits"
+        ):
+            fits.setdefault(key, []).append((title, score))
+        for key, created_at, years, quality in conn.execute(
+            "SELECT content_hash, created_at, years_experience, quality_score "
+            "FROM analyses ORDER BY created_at"
+        ):
+            agg._add(created_at, years, quality, skills.get(key, []), fits.get(key, []))
+        return agg
@@ -4,84 +4,223 @@
 import pdfplumber
 import pytesseract
 from PIL import Image
+import codecs
 import io
-import re
+import mmap
+import os
+import tempfile
 from pathlib import Path
 
+from .normalization import clean_text
+
+# Size limits for uploads and extracted text
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+MAX_TEXT_CHARS = 200_000
+SPOOL_CHUNK_BYTES = 1024 * 1024
+
 class ResumeExtractor:
-    """Extract text from resume files"""
+    """Extract text from resume files (paths, mmap buffers or file objects)"""
     
     @staticmethod
-    def extract_from_pdf(pdf_file) -> str:
-        """Extract text from PDF file"""
+    def spool_upload(file_obj, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+        """Copy an upload to a temp file in chunks and return its path.
+
+        The caller owns the file and should remove it when done.
+        """
+        size = getattr(file_obj, "size", None)
+        if size is not None and size > max_bytes:
+            raise ValueError(f"File too large: {size} bytes (limit {max_bytes})")
+        suffix = Path(getattr(file_obj, "name", "")).suffix
+        fd, path = tempfile.mkstemp(prefix="resume_", suffix=suffix)
+        written = 0
         try:
-            text = ""
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = file_obj.read(SPOOL_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise ValueError(f"File too large: over {max_bytes} bytes")
+                    out.write(chunk)
+        except Exception:
+            os.remove(path)
+            raise
+        return path
+    
+    @staticmethod
+    def open_mmap(path: str) -> mmap.mmap:
+        """Map a file read-only so parsers can use it as a buffer"""
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    @staticmethod
+    def extract_from_pdf(pdf_file, max_chars: int = MAX_TEXT_CHARS) -> str:
+        """Extract text from PDF file, stopping once max_chars is reached"""
+        try:
+            parts = []
+            total = 0
+            if isinstance(pdf_file, mmap.mmap):
+                pdf_file = _MmapReader(pdf_file)
             with pdfplumber.open(pdf_file) as pdf:
                 for page in pdf.pages:
-                    text += page.extract_text() or ""
-            return text.strip()
+                    page_text = page.extract_text() or ""
+                    parts.append(page_text)
+                    total += len(page_text)
+                    # Drop parsed page objects so memory stays flat on long PDFs
+                    page.flush_cache()
+                    if total >= max_chars:
+                        break
+            return "".join(parts)[:max_chars].strip()
         except Exception as e:
             raise ValueError(f"Error extracting PDF: {str(e)}")
     
     @staticmethod
-    def extract_from_image(image_file) -> str:
+    def extract_from_image(image_file, max_chars: int = MAX_TEXT_CHARS) -> str:
         """Extract text from image using OCR"""
         try:
+            if isinstance(image_file, mmap.mmap):
+                image_file = _MmapReader(image_file)
             image = Image.open(image_file)
             image = image.resize((image.width * 2, image.height * 2))
             text = pytesseract.image_to_string(image)
-            return text.strip()
+            return text[:max_chars].strip()
         except Exception as e:
             raise ValueError(f"Error extracting image: {str(e)}")
     
     @staticmethod
-    def extract_from_docx(docx_file) -> str:
+    def extract_from_scanned_pdf(pdf_file, max_chars: int = MAX_TEXT_CHARS,
+                                 resolution: int = 300) -> str:
+        """OCR a PDF without a text layer by rasterising each page"""
+        try:
+            parts = []
+            total = 0
+            if isinstance(pdf_file, mmap.mmap):
+                pdf_file = _MmapReader(pdf_file)
+            with pdfplumber.open(pdf_file) as pdf:
+                for page in pdf.pages:
+                    image = page.to_image(resolution=resolution).original
+                    page_text = pytesseract.image_to_string(image)
+                    parts.append(page_text)
+                    total += len(page_text)
+                    page.flush_cache()
+                    if total >= max_chars:
+                        break
+            return "".join(parts)[:max_chars].strip()
+        except Exception as e:
+            raise ValueError(f"Error extracting scanned PDF: {str(e)}")
+    
+    @staticmethod
+    def extract_from_docx(docx_file, max_chars: int = MAX_TEXT_CHARS) -> str:
         """Extract text from DOCX file"""
         try:
             from docx import Document
+            if isinstance(docx_file, mmap.mmap):
+                docx_file = _MmapReader(docx_file)
+            elif isinstance(docx_file, Path):
+                docx_file = str(docx_file)
             doc = Document(docx_file)
-            text = ""
+            parts = []
+            total = 0
             for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+                parts.append(paragraph.text)
+                total += len(paragraph.text) + 1
+                if total >= max_chars:
+                    break
+            return "\n".join(parts)[:max_chars].strip()
         except Exception as e:
             raise ValueError(f"Error extracting DOCX: {str(e)}")
     
     @staticmethod
-    def extract_from_txt(txt_file) -> str:
-        """Extract text from TXT file"""
+    def extract_from_txt(txt_file, max_chars: int = MAX_TEXT_CHARS) -> str:
+        """Extract text from TXT file, decoding incrementally up to max_chars"""
         try:
-            content = txt_file.read().decode('utf-8', errors='ignore')
-            return content.strip()
+            if isinstance(txt_file, (str, Path)):
+                with open(txt_file, "rb") as f:
+                    return ResumeExtractor.extract_from_txt(f, max_chars)
+            if isinstance(txt_file, mmap.mmap):
+                txt_file = _MmapReader(txt_file)
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+            parts = []
+            total = 0
+            while total < max_chars:
+                chunk = txt_file.read(SPOOL_CHUNK_BYTES)
+                if not chunk:
+                    parts.append(decoder.decode(b"", final=True))
+                    break
+                piece = decoder.decode(chunk)
+                parts.append(piece)
+                total += len(piece)
+            return "".join(parts)[:max_chars].strip()
         except Exception as e:
             raise ValueError(f"Error extracting TXT: {str(e)}")
     
     @staticmethod
-    def extract(file_obj, file_type: str) -> str:
-        """Main extraction method"""
+    def extract(file_obj, file_type: str, max_chars: int = MAX_TEXT_CHARS) -> str:
+        """Main extraction method; file_obj may be a path, mmap or file object"""
         file_type = file_type.lower()
         
         if file_type == "pdf":
-            return ResumeExtractor.extract_from_pdf(file_obj)
+            return ResumeExtractor.extract_from_pdf(file_obj, max_chars)
         elif file_type in ["jpg", "jpeg", "png", "bmp", "gif"]:
-            return ResumeExtractor.extract_from_image(file_obj)
+            return ResumeExtractor.extract_from_image(file_obj, max_chars)
         elif file_type == "docx":
-            return ResumeExtractor.extract_from_docx(file_obj)
+            return ResumeExtractor.extract_from_docx(file_obj, max_chars)
         elif file_type == "txt":
-            return ResumeExtractor.extract_from_txt(file_obj)
+            return ResumeExtractor.extract_from_txt(file_obj, max_chars)
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
+    
+    @staticmethod
+    def extract_upload(file_obj, file_type: str, max_bytes: int = MAX_UPLOAD_BYTES,
+                       max_chars: int = MAX_TEXT_CHARS) -> str:
+        """Spool an upload to disk and extract from the file path"""
+        path = ResumeExtractor.spool_upload(file_obj, max_bytes)
+        try:
+            return ResumeExtractor.extract(path, file_type, max_chars)
+        finally:
+            os.remove(path)
+
+
+class _MmapReader(io.RawIOBase):
+    """Seekable read-only file interface over an mmap, without copying it"""
+    
+    def __init__(self, buf: mmap.mmap):
+        self._buf = buf
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        end = min(self._pos + len(b), len(self._buf))
+        n = end - self._pos
+        b[:n] = self._buf[self._pos:end]
+        self._pos = end
+        return n
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = len(self._buf) + offset
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
 
 class TextCleaner:
     """Clean and normalize extracted text"""
     
     @staticmethod
     def clean(text: str) -> str:
-        """Clean extracted text"""
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^a-zA-Z0-9\s\.\-+()@]', ' ', text)
-        text = re.sub(r' +', ' ', text)
-        return text.strip()
+        """Clean extracted text (single translate pass, see normalization.clean_text)"""
+        return clean_text(text)
     
     @staticmethod
     def normalize_sections(text: str) -> dict:
@@ -0,0 +1,177 @@
+"""
+Typo-Tolerant Term Matching - symmetric-delete (SymSpell-style) index
+Text is tokenized once; exact token hits are dict lookups, misses are resolved
+against precomputed deletions so cost stays near-linear in token count
+"""
+
+import hashlib
+import pickle
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; keeps "node.js", "scikit-learn", "c++" whole."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def allowed_distance(word: str, max_distance: int) -> int:
+    """Edit budget for a dictionary word: short words must match exactly.
+
+    Short terms sit one edit away from ordinary words ("react"/"reach"), so
+    only longer terms get typo tolerance.
+    """
+    if len(word) <= 5:
+        return 0
+    if len(word) <= 8:
+        return min(1, max_distance)
+    return max_distance
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """All strings reachable from word by up to ``distance`` deletions."""
+    result = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+def _osa_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or limit + 1 once it is exceeded."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzyMatcher:
+    """Match dictionary terms in text with word boundaries and typo tolerance.
+
+    ``terms`` maps each surface form (e.g. "k8s", "machine learning") to the
+    canonical name reported on a match.
+    """
+
+    def __init__(self, terms: Dict[str, str], max_distance: int = 2):
+        self.max_distance = max_distance
+        self.phrases: Dict = {}
+        self.vocab: Set[str] = set()
+        self.max_words = 0
+        for surface, canonical in terms.items():
+            words = tokenize(surface)
+            if not words:
+                continue
+            node = self.phrases
+            for word in words:
+                node = node.setdefault(word, {})
+            node[None] = canonical
+            self.vocab.update(words)
+            self.max_words = max(self.max_words, len(words))
+
+        self.deletes: Dict[str, List[str]] = {}
+        for word in self.vocab:
+            for d in _deletes(word, allowed_distance(word, max_distance)):
+                self.deletes.setdefault(d, []).append(word)
+        self._corrections: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def cached(cls, terms: Dict[str, str], cache_dir, max_distance: int = 2) -> "FuzzyMatcher":
+        """Load a persisted index for these terms, building and saving it if missing."""
+        digest = hashlib.sha256(
+            repr((sorted(terms.items()), max_distance)).encode("utf-8")
+        ).hexdigest()[:16]
+        path = Path(cache_dir) / f"fuzzy_{digest}.pkl"
+        if path.exists():
+            try:
+                with open(path, "rb") as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+        matcher = cls(terms, max_distance)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+        except OSError:
+            pass
+        return matcher
+
+    def correct(self, token: str) -> Optional[str]:
+        """Closest vocabulary word for a token, or None."""
+        if token in self.vocab:
+            return token
+        if token in self._corrections:
+            return self._corrections[token]
+
+        best, best_distance = None, self.max_distance + 1
+        if len(token) > 5 - self.max_distance:
+            seen = set()
+            for d in _deletes(token, self.max_distance):
+                for candidate in self.deletes.get(d, ()):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    limit = allowed_distance(candidate, self.max_distance)
+                    distance = _osa_distance(token, candidate, limit)
+                    if distance <= limit and (distance, candidate) < (best_distance, best or ""):
+                        best, best_distance = candidate, distance
+
+        # Bound the memo so adversarial input cannot grow it without limit
+        if len(self._corrections) < 100_000:
+            self._corrections[token] = best
+        return best
+
+    def find(self, text: str) -> List[str]:
+        """Distinct canonical terms found in text, in order of appearance."""
+        return list(dict.fromkeys(self.find_all(text)))
+
+    def find_all(self, text: str) -> List[str]:
+        """Canonical terms for every (longest, non-overlapping) match in text."""
+        return self.find_tokens(tokenize(text))
+
+    def find_tokens(self, tokens: List[str]) -> List[str]:
+        """Match pre-tokenized text."""
+        words = [self.correct(t) for t in tokens]
+        found = []
+        i = 0
+        while i < len(words):
+            node = self.phrases
+            best, best_end = None, i
+            j = i
+            while j < len(words) and j - i < self.max_words:
+                node = node.get(words[j]) if words[j] else None
+                if node is None:
+                    break
+                j += 1
+                if None in node:
+                    best, best_end = node[None], j
+            if best is None:
+                i += 1
+            else:
+                found.append(best)
+                i = best_end
+        return found
+
+    def __getstate__(self) -> Tuple:
+        return (self.max_distance, self.phrases, self.vocab, self.max_words, self.deletes)
+
+    def __setstate__(self, state: Tuple) -> None:
+        self.max_distance, self.phrases, self.vocab, self.max_words, self.deletes = state
+        self._corrections = {}
@@ -4,12 +4,22 @@ No external dependencies beyond scikit-learn/numpy
 """
 
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from collections import Counter
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from utils.constants import FUZZY_INDEX_CACHE_DIR
+from .fuzzy_matcher import FuzzyMatcher, tokenize
+
+
+@lru_cache(maxsize=8)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> FuzzyMatcher:
+    """Fuzzy index over a catalog's lowercased job keywords."""
+    return FuzzyMatcher.cached({k: k for k in keywords}, FUZZY_INDEX_CACHE_DIR)
+
 class JobMatcher:
     """Job matching using TF-IDF + keyword analysis."""
     
@@ -25,53 +35,77 @@ class JobMatcher:
         words = [w for w in text.split() if w not in stop_words and len(w) > 2]
         return ' '.join(words)
     
+    @staticmethod
+    def resume_skill_list(skills_dict: dict) -> List[str]:
+        """Lowercased technical skills from an extract_skills result."""
+        if skills_dict and 'Technical Skills' in skills_dict:
+            return [skill.lower() for skill in skills_dict['Technical Skills']]
+        return []
+    
+    @staticmethod
+    def matched_terms(tokens: List[str], resume_skills: List[str], keywords: Tuple[str, ...]) -> set:
+        """Lowercased catalog keywords present in a tokenized resume or its skills."""
+        return set(_keyword_matcher(keywords).find_tokens(tokens)) | set(resume_skills)
+    
+    @staticmethod
+    def catalog_keywords(jobs: List[Dict]) -> Tuple[str, ...]:
+        """Sorted distinct lowercased keywords across a job list."""
+        return tuple(sorted({k.lower() for job in jobs for k in job.get('keywords', [])}))
+    
+    @staticmethod
+    def score_job(job: Dict, found: set, resume_skills: List[str]) -> Dict:
+        """Fit score for one job given the resume's matched keyword set."""
+        job_title = job.get('title', '')
+        job_keywords = job.get('keywords', [])
+        
+        # Keyword matching (case-insensitive)
+        matched_keywords = []
+        missing_keywords = []
+        
+        for keyword in job_keywords:
+            # Check resume text + extracted skills
+            if keyword.lower() in found:
+                matched_keywords.append(keyword)
+            else:
+                missing_keywords.append(keyword)
+        
+        # Calculate scores
+        keyword_match_score = len(matched_keywords) / max(len(job_keywords), 1) * 100
+        job_keywords_lower = {k.lower() for k in job_keywords}
+        skills_match_score = sum(1 for skill in resume_skills if skill in job_keywords_lower) / max(len(resume_skills), 1) * 100
+        
+        # Combined fit score
+        fit_score = (keyword_match_score * 0.6 + skills_match_score * 0.4)
+        
+        return {
+            'job_title': job_title,
+            'fit_score': round(fit_score, 1),
+            'keyword_match': round(keyword_match_score, 1),
+            'matched_keywords': matched_keywords[:10],
+            'missing_keywords': missing_keywords[:8],
+            'matched_count': len(matched_keywords),
+            'keywords_count': len(job_keywords),
+        }
+    
     @staticmethod
     def rank_jobs(resume_text: str, skills_dict: dict, jobs: List[Dict]) -> List[Dict]:
         """Rank jobs by fit score using TF-IDF + keyword matching."""
-        results = []
-        
-        # Extract skills from resume
-        resume_skills = []
-        if skills_dict and 'Technical Skills' in skills_dict:
-            resume_skills = [skill.lower() for skill in skills_dict['Technical Skills']]
+        resume_skills = JobMatcher.resume_skill_list(skills_dict)
         
-        for job in jobs:
-            job_title = job.get('title', '')
-            job_keywords = job.get('keywords', [])
-            
-            # Keyword matching (case-insensitive)
-            matched_keywords = []
-            missing_keywords = []
-            
-            for keyword in job_keywords:
-                keyword_lower = keyword.lower()
-                # Check resume text + extracted skills
-                if (keyword_lower in resume_text.lower() or 
-                    keyword_lower in ' '.join(resume_skills)):
-                    matched_keywords.append(keyword)
-                else:
-                    missing_keywords.append(keyword)
-            
-            # Calculate scores
-            keyword_match_score = len(matched_keywords) / max(len(job_keywords), 1) * 100
-            skills_match_score = sum(1 for skill in resume_skills if skill in [k.lower() for k in job_keywords]) / max(len(resume_skills), 1) * 100
-            
-            # Combined fit score
-            fit_score = (keyword_match_score * 0.6 + skills_match_score * 0.4)
-            
-            results.append({
-                'job_title': job_title,
-                'fit_score': round(fit_score, 1),
-                'keyword_match': round(keyword_match_score, 1),
-                'matched_keywords': matched_keywords[:10],
-                'missing_keywords': missing_keywords[:8],
-                'matched_count': len(matched_keywords),
-                'keywords_count': len(job_keywords),
-            })
+        # Match every catalog keyword against the resume once (word boundaries, typo tolerant)
+        found = JobMatcher.matched_terms(
+            tokenize(resume_text), resume_skills, JobMatcher.catalog_keywords(jobs)
+        )
+        results = [JobMatcher.score_job(job, found, resume_skills) for job in jobs]
         
         # Sort by fit score
         return sorted(results, key=lambda x: x['fit_score'], reverse=True)
     
+    @staticmethod
+    def recommend_jobs(resume_text: str, ann_index, k: int = 10) -> List[Dict]:
+        """Similarity-based recommendations from a JobANNIndex (no shared vocabulary needed)."""
+        return ann_index.query(resume_text, k)
+    
     @staticmethod
     def get_improvement_suggestions(missing_keywords: List[str]) -> List[str]:
         """Generate suggestions based on missing keywords."""
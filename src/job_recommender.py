@@ -0,0 +1,123 @@
+"""
+Approximate Nearest-Neighbour Job Recommendations
+HashingVectorizer -> sparse random projection -> IVF coarse quantizer (k-means lists)
+Jobs in the probed lists are re-ranked by exact cosine on the hashed vectors
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.random_projection import SparseRandomProjection
+
+from .job_matcher import JobMatcher
+
+
+def job_text(job: Dict) -> str:
+    """Text used to embed a posting: title, keywords and optional description."""
+    return " ".join([job.get("title", ""), " ".join(job.get("keywords", [])), job.get("description", "")])
+
+
+class JobANNIndex:
+    """Inverted-file index over projected job vectors.
+
+    Jobs are bucketed by their nearest k-means centroid; a query scans only
+    the ``n_probe`` closest lists. Raising ``n_probe`` (or lowering
+    ``n_lists``) trades latency for recall. ``exact_rerank`` scores the
+    scanned jobs on the full hashed vectors instead of the lossy projection.
+    """
+
+    def __init__(self, jobs: List[Dict], n_features: int = 2 ** 18, n_components: int = 256,
+                 n_lists: Optional[int] = None, n_probe: int = 8, kmeans_iters: int = 10,
+                 exact_rerank: bool = True, random_state: int = 0, batch_size: int = 10_000):
+        self.jobs = jobs
+        self.n_probe = n_probe
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features, alternate_sign=False, norm="l2",
+            preprocessor=JobMatcher.preprocess_text, ngram_range=(1, 2),
+        )
+        # Random projection only needs the input width, not the data
+        self.projection = SparseRandomProjection(
+            n_components=n_components, dense_output=True, random_state=random_state
+        ).fit(self.vectorizer.transform(["fit"]))
+
+        self.vectors = np.zeros((len(jobs), n_components), dtype=np.float32)
+        hashed = []
+        for start in range(0, len(jobs), batch_size):
+            chunk = jobs[start:start + batch_size]
+            sparse_chunk = self.vectorizer.transform([job_text(j) for j in chunk])
+            self.vectors[start:start + len(chunk)] = self._project(sparse_chunk)
+            if exact_rerank:
+                hashed.append(sparse_chunk)
+        self.hashed = sparse.vstack(hashed).tocsr() if hashed else None
+
+        n_lists = n_lists or max(1, int(np.sqrt(len(jobs))))
+        self.centroids = self._kmeans(n_lists, kmeans_iters, np.random.default_rng(random_state))
+        assignment = self._nearest(self.vectors)
+        # Inverted lists as one sorted id array plus offsets
+        self.list_order = np.argsort(assignment, kind="stable")
+        self.list_offsets = np.searchsorted(assignment[self.list_order], np.arange(n_lists + 1))
+
+    def _project(self, hashed) -> np.ndarray:
+        projected = self.projection.transform(hashed).astype(np.float32)
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        return projected / np.maximum(norms, 1e-12)
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Unit-length projected vectors for texts."""
+        return self._project(self.vectorizer.transform(texts))
+
+    def _nearest(self, vectors: np.ndarray, batch_size: int = 8192) -> np.ndarray:
+        """Index of the most similar centroid for each vector."""
+        out = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), batch_size):
+            out[start:start + batch_size] = np.argmax(
+                vectors[start:start + batch_size] @ self.centroids.T, axis=1
+            )
+        return out
+
+    def _kmeans(self, n_lists: int, iters: int, rng) -> np.ndarray:
+        """Spherical k-means on a sample of job vectors."""
+        if len(self.vectors) == 0:
+            return np.zeros((n_lists, self.vectors.shape[1]), dtype=np.float32)
+        sample_size = min(len(self.vectors), max(n_lists * 64, 10_000))
+        sample = self.vectors[rng.choice(len(self.vectors), sample_size, replace=False)]
+        self.centroids = sample[rng.choice(len(sample), n_lists, replace=len(sample) < n_lists)].copy()
+        for _ in range(iters):
+            labels = self._nearest(sample)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            # Empty lists keep their previous centroid
+            filled = counts > 0
+            norms = np.linalg.norm(sums[filled], axis=1, keepdims=True)
+            self.centroids[filled] = sums[filled] / np.maximum(norms, 1e-12)
+        return self.centroids
+
+    def candidates(self, vector: np.ndarray, n_probe: Optional[int] = None) -> np.ndarray:
+        """Job ids in the lists whose centroids are closest to the query."""
+        n_probe = min(self.n_probe if n_probe is None else n_probe, len(self.centroids))
+        scores = self.centroids @ vector
+        probed = np.argpartition(-scores, n_probe - 1)[:n_probe]
+        return np.concatenate([
+            self.list_order[self.list_offsets[c]:self.list_offsets[c + 1]] for c in probed
+        ])
+
+    def query(self, text: str, k: int = 10, n_probe: Optional[int] = None) -> List[Dict]:
+        """Top-k jobs by cosine similarity among the probed lists."""
+        hashed = self.vectorizer.transform([text])
+        vector = self._project(hashed)[0]
+        ids = self.candidates(vector, n_probe)
+        if len(ids) == 0:
+            return []
+        if self.hashed is not None:
+            scores = (self.hashed[ids] @ hashed.T).toarray().ravel()
+        else:
+            scores = self.vectors[ids] @ vector
+        top = np.argsort(-scores)[:k]
+        return [
+            {"job_index": int(ids[i]), "job_title": self.jobs[ids[i]].get("title", ""),
+             "similarity": round(float(scores[i]), 4)}
+            for i in top
+        ]
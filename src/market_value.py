@@ -0,0 +1,154 @@
+"""
+Market Value Estimation - dense percentile table + NumPy batch lookups
+Table axes: level x skill bucket x title family, values are (p25, p50, p75) in $k
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .title_taxonomy import get_taxonomy
+
+DEFAULT_SALARY_PATH = Path(__file__).resolve().parent.parent / "data" / "salary_bands.csv"
+
+LEVELS = ["Junior", "Mid-level", "Senior", "Lead"]
+SKILL_BUCKETS = ["0-4", "5-9", "10-14", "15+"]
+TITLE_FAMILIES = ["General", "Software", "Data", "ML", "Management"]
+PERCENTILES = ["p25", "p50", "p75"]
+
+# Upper-exclusive edges: <2 years Junior, <5 Mid-level, <8 Senior, else Lead
+YEARS_EDGES = np.array([2, 5, 8])
+SKILL_EDGES = np.array([5, 10, 15])
+
+_PROGRESSION_FAMILIES = {
+    "Junior Developer": "Software",
+    "Senior Developer": "Software",
+    "Data Scientist": "Data",
+    "ML Engineer": "ML",
+}
+
+
+def title_family(title: str) -> str:
+    """Map a job title to its salary-table family via the title taxonomy."""
+    entry = get_taxonomy().lookup(title) if title else None
+    if entry is None:
+        return "General"
+    family = _PROGRESSION_FAMILIES.get(entry["progression"])
+    if family:
+        return family
+    return "Management" if entry["level"] == "Lead" else "General"
+
+
+class SalaryTable:
+    """Percentile salary bands stored as a dense array for O(1) lookups."""
+
+    def __init__(self, table: np.ndarray):
+        expected = (len(LEVELS), len(SKILL_BUCKETS), len(TITLE_FAMILIES), len(PERCENTILES))
+        if table.shape != expected:
+            raise ValueError(f"Salary table has shape {table.shape}, expected {expected}")
+        self.table = table
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_SALARY_PATH) -> "SalaryTable":
+        """Load precomputed bands (level, skill_bucket, title_family, p25, p50, p75)."""
+        return cls.from_bands(pd.read_csv(path))
+
+    @classmethod
+    def from_bands(cls, bands: pd.DataFrame) -> "SalaryTable":
+        """Build the dense table from one row per (level, bucket, family) cell.
+
+        Missing families fall back to the level/bucket "General" row.
+        """
+        table = np.full(
+            (len(LEVELS), len(SKILL_BUCKETS), len(TITLE_FAMILIES), len(PERCENTILES)), np.nan
+        )
+        li = bands["level"].map({v: i for i, v in enumerate(LEVELS)})
+        bi = bands["skill_bucket"].map({v: i for i, v in enumerate(SKILL_BUCKETS)})
+        fi = bands["title_family"].map({v: i for i, v in enumerate(TITLE_FAMILIES)})
+        valid = li.notna() & bi.notna() & fi.notna()
+        table[
+            li[valid].astype(int).to_numpy(),
+            bi[valid].astype(int).to_numpy(),
+            fi[valid].astype(int).to_numpy(),
+        ] = bands.loc[valid, PERCENTILES].to_numpy(dtype=float)
+
+        general = table[:, :, :1, :]
+        table = np.where(np.isnan(table), general, table)
+        if np.isnan(table).any():
+            raise ValueError("Salary bands must cover every level and skill bucket")
+        return cls(table)
+
+    @classmethod
+    def from_observations(cls, salaries: pd.DataFrame) -> "SalaryTable":
+        """Build bands from raw rows of (years_experience, skills_count, title, salary_k)."""
+        frame = pd.DataFrame({
+            "level": np.asarray(LEVELS)[np.searchsorted(
+                YEARS_EDGES, salaries["years_experience"].to_numpy(), side="right")],
+            "skill_bucket": np.asarray(SKILL_BUCKETS)[np.searchsorted(
+                SKILL_EDGES, salaries["skills_count"].to_numpy(), side="right")],
+            "title_family": _families(salaries["title"].to_numpy()),
+            "salary_k": salaries["salary_k"].to_numpy(dtype=float),
+        })
+        grouped = frame.groupby(["level", "skill_bucket", "title_family"])["salary_k"]
+        bands = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+        bands.columns = PERCENTILES
+        return cls.from_bands(bands.reset_index())
+
+    def estimate(self, years_experience: Sequence[float], skills_count: Sequence[int],
+                 levels: Optional[Sequence[str]] = None,
+                 titles: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Vectorized salary ranges for a pool of candidates.
+
+        ``levels`` overrides the experience-derived level where it names a
+        known level; ``titles`` selects the title family (default General).
+        """
+        years = np.asarray(years_experience, dtype=float)
+        skills = np.asarray(skills_count, dtype=float)
+        # Unknown (NaN) or negative inputs fall back to the lowest band, as the
+        # scalar path does, instead of sorting past the last edge
+        years = np.where(np.isfinite(years) & (years >= 0), years, 0.0)
+        skills = np.where(np.isfinite(skills) & (skills >= 0), skills, 0.0)
+
+        level_idx = np.searchsorted(YEARS_EDGES, years, side="right")
+        if levels is not None:
+            given = _codes(levels, {v: i for i, v in enumerate(LEVELS)})
+            level_idx = np.where(given >= 0, given, level_idx)
+        bucket_idx = np.searchsorted(SKILL_EDGES, skills, side="right")
+        if titles is None:
+            family_idx = np.zeros(len(years), dtype=np.intp)
+        else:
+            family_idx = _codes(_families(titles), {v: i for i, v in enumerate(TITLE_FAMILIES)})
+
+        bands = self.table[level_idx, bucket_idx, family_idx]
+        return {
+            "level": np.asarray(LEVELS)[level_idx],
+            "p25": bands[:, 0],
+            "p50": bands[:, 1],
+            "p75": bands[:, 2],
+        }
+
+
+def _codes(values: Sequence[str], mapping: Dict[str, int]) -> np.ndarray:
+    """Map strings to integer codes via their unique values (-1 if unknown)."""
+    uniques, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    codes = np.array([mapping.get(u, -1) for u in uniques], dtype=np.intp)
+    return codes[inverse]
+
+
+def _families(titles: Sequence[str]) -> np.ndarray:
+    """Title family per title, resolving each distinct title only once."""
+    uniques, inverse = np.unique(np.asarray(titles, dtype=str), return_inverse=True)
+    return np.array([title_family(t) for t in uniques], dtype=object)[inverse]
+
+
+_default_table: Optional[SalaryTable] = None
+
+
+def get_salary_table() -> SalaryTable:
+    """Shared salary table loaded once from the default CSV."""
+    global _default_table
+    if _default_table is None:
+        _default_table = SalaryTable.from_csv()
+    return _default_table
@@ -1,22 +1,38 @@
 import re
-import nltk
-from nltk.corpus import stopwords
 
-nltk.download('stopwords', quiet=True)
+from utils.constants import (
+    SKILL_CATEGORIES, EXTRA_SKILLS, SKILL_ALIASES, AMBIGUOUS_SKILLS, FUZZY_INDEX_CACHE_DIR
+)
+from .fuzzy_matcher import FuzzyMatcher
+from .normalization import extract_contact
+
+_skill_matcher = None
+
+
+def get_skill_matcher():
+    """Typo-tolerant matcher over the skill dictionary, built once per process."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        terms = {
+            skill: skill
+            for skills in SKILL_CATEGORIES.values()
+            for skill in skills
+            if skill not in AMBIGUOUS_SKILLS
+        }
+        terms.update({skill: skill for skill in EXTRA_SKILLS})
+        terms.update(SKILL_ALIASES)
+        _skill_matcher = FuzzyMatcher.cached(terms, FUZZY_INDEX_CACHE_DIR)
+    return _skill_matcher
 
 class NLPProcessor:
-    """NLP Processor - regex + NLTK (cloud deploy ready)."""
+    """NLP Processor - regex + fuzzy skill index (cloud deploy ready)."""
     
     def __init__(self):
         self.nlp = None
 
     def extract_contact_info(self, text):
-        emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        phones = re.findall(r'[\+]?[1-9][\d]{7,15}', text)
-        return {
-            'email': emails[0] if emails else None,
-            'phone': phones[0] if phones else None
-        }
+        """Email, normalized phone, LinkedIn and GitHub URLs (first match of each)."""
+        return extract_contact(text)
 
     def extract_education(self, text):
         edu_keywords = ['bachelor', 'master', 'm.tech', 'phd', 'b.tech']
@@ -56,44 +72,6 @@ class NLPProcessor:
         return projects
 
     def extract_skills(self, text):
-        stop_words = set(stopwords.words('english'))
-        skills_patterns = [
-            r'(python|java|javascript|react|nodejs?|sql|docker|aws|azure|kubernetes?|k8s?)',
-            r'(machine learning|deep learning|nlp|tensorflow|pytorch|scikit[-_]?learn)',
-            r'(git|github|jenkins|flask|django|fastapi)'
-        ]
-        
-        all_skills = []
-        text_lower = text.lower()
-        
-        for pattern in skills_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    skill_str = '.'.join(str(x) for x in match if x)
-                else:
-                    skill_str = str(match)
-                all_skills.append(skill_str)
-        
-        skill_mapping = {
-            'js': 'JavaScript',
-            'node js': 'Node.js',
-            'tf': 'TensorFlow',
-            'k8s': 'Kubernetes',
-            'aws': 'AWS'
-        }
-        
-        normalized_skills = []
-        seen = set()
-        for skill in all_skills:
-            skill_lower = skill.lower().strip()
-            if skill_lower in skill_mapping:
-                mapped_skill = skill_mapping[skill_lower]
-                if mapped_skill not in seen:
-                    normalized_skills.append(mapped_skill)
-                    seen.add(mapped_skill)
-            elif skill_lower not in seen and len(skill_lower) > 1:
-                normalized_skills.append(skill.title())
-                seen.add(skill_lower)
-        
-        return {'Technical Skills': normalized_skills[:20]}, len(normalized_skills)
+        """Skills matched on word boundaries, tolerating typos ("Pyhton", "Kubernates")."""
+        skills = get_skill_matcher().find(text)
+        return {'Technical Skills': skills[:20]}, len(skills)
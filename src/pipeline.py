@@ -0,0 +1,311 @@
+"""
+Staged Ingestion Pipeline - reader -> extract -> OCR -> NLP/scoring -> rank -> sink
+Bounded queues between stages give backpressure; each stage has its own pool
+"""
+
+import io
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .catalog_manager import CatalogSnapshot
+from .extractors import ResumeExtractor
+from .nlp_processor import NLPProcessor
+from .resume_scorer import ResumeScorer
+
+IMAGE_TYPES = {"jpg", "jpeg", "png", "bmp", "gif"}
+
+_DONE = object()
+
+
+def extract_document(data: bytes, file_type: str) -> str:
+    """Extract text from raw file bytes (runs in a worker process)."""
+    return ResumeExtractor.extract(io.BytesIO(data), file_type)
+
+
+def analyze_text(resume_text: str) -> Dict:
+    """Run NLP extraction and quality scoring on resume text."""
+    nlp = NLPProcessor()
+    start, end = nlp.extract_years_experience(resume_text)
+    skills_dict, count = nlp.extract_skills(resume_text)
+    quality_score, _ = ResumeScorer.calculate_quality_score(resume_text)
+    return {
+        "contact": nlp.extract_contact_info(resume_text),
+        "education": nlp.extract_education(resume_text),
+        "skills": skills_dict,
+        "skill_count": count,
+        "years_experience": int(end - start) if start and end else 0,
+        "projects": nlp.extract_projects(resume_text),
+        "quality_score": quality_score,
+    }
+
+
+# Catalog of the current rank worker process, set once by init_rank_worker
+_CATALOG: Optional[CatalogSnapshot] = None
+
+
+def init_rank_worker(jobs: List[Dict]) -> None:
+    """Process pool initializer: build the keyword index once per worker."""
+    global _CATALOG
+    _CATALOG = CatalogSnapshot(0, jobs, digest="")
+
+
+def rank_text(resume_text: str, skills_dict: Dict) -> List[Dict]:
+    """Rank jobs for one resume against the worker's catalog."""
+    return _CATALOG.rank_jobs(resume_text, skills_dict)
+
+
+class StageMetrics:
+    """Throughput, utilization and queue-depth counters for one stage."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self._lock = threading.Lock()
+
+    def observe(self, depth: int, busy: float, failed: bool) -> None:
+        with self._lock:
+            self.processed += 1
+            self.errors += int(failed)
+            self.busy_seconds += busy
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    def summary(self, elapsed: float) -> Dict:
+        capacity = max(elapsed * self.workers, 1e-9)
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "processed": self.processed,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "utilization": round(min(1.0, self.busy_seconds / capacity), 3),
+            "mean_queue_depth": round(self._depth_total / max(self._depth_samples, 1), 2),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class _Stage:
+    """A pool of worker threads draining one bounded inbox.
+
+    ``handler`` returns the next queue to forward the item to (or None to
+    drop it). CPU-heavy handlers hand work to a process pool and block on
+    the future, so the thread count is the stage's in-flight limit.
+    """
+
+    def __init__(self, name: str, workers: int, inbox: queue.Queue,
+                 handler: Callable[[Dict], Optional[queue.Queue]],
+                 on_finish: Callable[[], None], on_error: Callable[[Dict], None]):
+        self.name = name
+        self.inbox = inbox
+        self.handler = handler
+        self.on_finish = on_finish
+        self.on_error = on_error
+        self.metrics = StageMetrics(name, workers)
+        self._remaining = workers
+        self._lock = threading.Lock()
+        self.threads = [
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+
+    def start(self) -> None:
+        for t in self.threads:
+            t.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self.inbox.get()
+            if item is _DONE:
+                break
+            depth = self.inbox.qsize()
+            began = time.perf_counter()
+            failed = False
+            try:
+                target = self.handler(item)
+            except Exception as e:
+                item["error"] = f"{self.name}: {e}"
+                failed = True
+                target = None
+            self.metrics.observe(depth, time.perf_counter() - began, failed)
+            if target is not None:
+                target.put(item)
+            elif failed:
+                self.on_error(item)
+        with self._lock:
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last:
+            self.on_finish()
+
+
+class IngestionPipeline:
+    """Overlap I/O, parsing, OCR and matching across a batch of resume files."""
+
+    def __init__(self, jobs: List[Dict], readers: int = 4,
+                 extractors: Optional[int] = None, ocr_workers: Optional[int] = None,
+                 analyzers: Optional[int] = None, rankers: Optional[int] = None,
+                 queue_size: int = 64, use_processes: bool = True):
+        cpus = os.cpu_count() or 2
+        self.jobs = jobs
+        self.concurrency = {
+            "reader": readers,
+            "extract": extractors or cpus,
+            "ocr": ocr_workers or cpus,
+            "analyze": analyzers or cpus,
+            "rank": rankers or max(1, cpus // 2),
+        }
+        self.queue_size = queue_size
+        self.use_processes = use_processes
+        self.metrics: Dict[str, Dict] = {}
+
+    def _executor(self, workers: int, initializer=None, initargs=()) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def run(self, paths: Iterable[str], sink: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Process files and return per-file results (or stream them to ``sink``)."""
+        c = self.concurrency
+        q = {name: queue.Queue(maxsize=self.queue_size)
+             for name in ["reader", "extract", "ocr", "analyze", "rank", "sink"]}
+        # Tesseract runs as a subprocess, so OCR stage threads call it directly
+        pools = {
+            "extract": self._executor(c["extract"]),
+            "analyze": self._executor(c["analyze"]),
+            # Catalog is shipped once per worker, not pickled with every resume
+            "rank": self._executor(c["rank"], init_rank_worker, (self.jobs,)),
+        }
+        # Thread pools share this process, so they rank against one local snapshot
+        rank_fn = rank_text if self.use_processes else CatalogSnapshot(0, self.jobs, digest="").rank_jobs
+        collected: List[Dict] = []
+        sink = sink or collected.append
+
+        def close(name: str, workers: int) -> Callable[[], None]:
+            def finish():
+                for _ in range(workers):
+                    q[name].put(_DONE)
+            return finish
+
+        def read(item):
+            item["data"] = Path(item["path"]).read_bytes()
+            return q["extract"]
+
+        def extract(item):
+            if item["file_type"] in IMAGE_TYPES:
+                return q["ocr"]
+            item["text"] = pools["extract"].submit(
+                extract_document, item["data"], item["file_type"]).result()
+            # A PDF without a text layer is a scan: send it on to OCR
+            if item["file_type"] == "pdf" and not item["text"]:
+                return q["ocr"]
+            item.pop("data")
+            return q["analyze"]
+
+        def ocr(item):
+            data = io.BytesIO(item.pop("data"))
+            if item["file_type"] == "pdf":
+                item["text"] = ResumeExtractor.extract_from_scanned_pdf(data)
+            else:
+                item["text"] = ResumeExtractor.extract_from_image(data)
+            return q["analyze"]
+
+        def analyze(item):
+            item["results"] = pools["analyze"].submit(analyze_text, item["text"]).result()
+            return q["rank"]
+
+        def rank(item):
+            item["job_fits"] = pools["rank"].submit(
+                rank_fn, item["text"], item["results"]["skills"]).result()
+            return q["sink"]
+
+        # Extract feeds both OCR and analyze; OCR only finishes after extract
+        # has drained, so analyze can close once OCR is done.
+        # Failed items skip ahead to the sink so callers see every input.
+        fail = q["sink"].put
+        stages = [
+            _Stage("reader", c["reader"], q["reader"], read, close("extract", c["extract"]), fail),
+            _Stage("extract", c["extract"], q["extract"], extract, close("ocr", c["ocr"]), fail),
+            _Stage("ocr", c["ocr"], q["ocr"], ocr, close("analyze", c["analyze"]), fail),
+            _Stage("analyze", c["analyze"], q["analyze"], analyze, close("rank", c["rank"]), fail),
+            _Stage("rank", c["rank"], q["rank"], rank, close("sink", 1), fail),
+        ]
+        for stage in stages:
+            stage.start()
+
+        sink_metrics = StageMetrics("sink", 1)
+        started = time.perf_counter()
+
+        # Set when the sink fails: the feeder stops queueing new files while
+        # the sink loop drains what is already in flight
+        cancel = threading.Event()
+        feed_errors: List[BaseException] = []
+
+        def feed():
+            try:
+                for path in paths:
+                    item = {
+                        "path": str(path),
+                        "file_name": Path(path).name,
+                        "file_type": Path(path).suffix.lstrip(".").lower(),
+                    }
+                    while not cancel.is_set():
+                        try:
+                            q["reader"].put(item, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if cancel.is_set():
+                        break
+            except Exception as e:
+                feed_errors.append(e)
+            finally:
+                close("reader", c["reader"])()
+
+        feeder = threading.Thread(target=feed, name="feeder", daemon=True)
+        feeder.start()
+
+        sink_error: Optional[Exception] = None
+        try:
+            while True:
+                item = q["sink"].get()
+                if item is _DONE:
+                    break
+                if sink_error is not None:
+                    continue
+                depth = q["sink"].qsize()
+                began = time.perf_counter()
+                item.pop("data", None)
+                try:
+                    sink(item)
+                except Exception as e:
+                    sink_error = e
+                    cancel.set()
+                    continue
+                sink_metrics.observe(depth, time.perf_counter() - began, "error" in item)
+        finally:
+            cancel.set()
+            feeder.join()
+            for pool in pools.values():
+                pool.shutdown()
+        if sink_error is not None:
+            raise sink_error
+        if feed_errors:
+            raise feed_errors[0]
+
+        elapsed = time.perf_counter() - started
+        self.metrics = {s.name: s.metrics.summary(elapsed) for s in stages}
+        self.metrics["sink"] = sink_metrics.summary(elapsed)
+        self.metrics["elapsed_seconds"] = round(elapsed, 3)
+        return collected
@@ -0,0 +1,25 @@
+"""
+Profile Report - summarize the analysis profiles stored by AnalysisProfiler
+Usage: python -m src.profile_report [profile_dir] [--top N] [--sort tottime|cumulative|ncalls]
+
+Kept out of src.profiling (which the package imports) so ``python -m`` does
+not re-execute an already imported module.
+"""
+
+import argparse
+
+from utils.constants import PROFILE_DIR
+from .profiling import summarize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize stored analysis profiles")
+    parser.add_argument("store_dir", nargs="?", default=PROFILE_DIR)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--sort", default="tottime", choices=["tottime", "cumulative", "ncalls"])
+    args = parser.parse_args()
+    print(summarize(args.store_dir, args.top, args.sort))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+On-Demand Analysis Profiling - cProfile runs saved to a bounded on-disk ring buffer
+Summarize stored profiles with: python -m src.profile_report [profile_dir] [--top N]
+"""
+
+import cProfile
+import hashlib
+import io
+import json
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from utils.constants import PROFILE_DIR, PROFILE_CAPACITY
+
+
+def fingerprint(data: Union[str, bytes], file_type: Optional[str] = None) -> Dict:
+    """Identify an input without storing it: hash, size and shape hints."""
+    raw = data.encode("utf-8", errors="ignore") if isinstance(data, str) else data
+    sample = raw[:65536]
+    return {
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "bytes": len(raw),
+        "file_type": file_type,
+        "lines": raw.count(b"\n") + 1,
+        "non_ascii_ratio": round(sum(b > 127 for b in sample) / max(len(sample), 1), 4),
+    }
+
+
+class AnalysisProfiler:
+    """Profiles selected analyses and keeps the last ``capacity`` runs on disk.
+
+    A run is profiled when forced or when it falls within ``sample_rate``.
+    Unselected runs execute directly with no profiler attached.
+    """
+
+    def __init__(self, store_dir: str = PROFILE_DIR, capacity: int = PROFILE_CAPACITY,
+                 sample_rate: float = 0.0):
+        self.store_dir = Path(store_dir)
+        self.capacity = capacity
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+
+    def selected(self, force: bool = False) -> bool:
+        if force:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def profile(self, data: Union[str, bytes, Callable[[], Union[str, bytes]]],
+                label: str = "analysis", file_type: Optional[str] = None, force: bool = False):
+        """Profile the enclosed block if this run is selected.
+
+        ``data`` may be a zero-argument callable so large inputs are only
+        read for fingerprinting when a profile is actually recorded.
+        """
+        if not self.selected(force):
+            yield None
+            return
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            if callable(data):
+                data = data()
+            self._save(profiler, {
+                "label": label,
+                "wall_seconds": round(elapsed, 4),
+                "recorded_at": time.time(),
+                "input": fingerprint(data, file_type),
+            })
+
+    def _next_slot(self) -> int:
+        """First free slot, else the slot holding the oldest profile."""
+        oldest_slot, oldest_time = 0, float("inf")
+        for slot in range(self.capacity):
+            meta = self.store_dir / f"profile_{slot:04d}.json"
+            if not meta.exists():
+                return slot
+            try:
+                recorded = json.loads(meta.read_text())["recorded_at"]
+            except (OSError, ValueError, KeyError):
+                return slot
+            if recorded < oldest_time:
+                oldest_slot, oldest_time = slot, recorded
+        return oldest_slot
+
+    def _save(self, profiler: cProfile.Profile, meta: Dict) -> None:
+        with self._lock:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            slot = self._next_slot()
+            meta["slot"] = slot
+            profiler.dump_stats(str(self.store_dir / f"profile_{slot:04d}.prof"))
+            (self.store_dir / f"profile_{slot:04d}.json").write_text(json.dumps(meta, indent=2))
+
+    def run_chain(self, source, file_type: str, jobs: List[Dict], force: bool = False) -> Dict:
+        """Extract -> NLP/scoring -> job ranking for one file, profiled if selected."""
+        from .extractors import ResumeExtractor
+        from .job_matcher import JobMatcher
+        from .pipeline import analyze_text
+
+        data = Path(source).read_bytes() if isinstance(source, (str, Path)) else source
+        with self.profile(data, label="chain", file_type=file_type, force=force):
+            text = ResumeExtractor.extract(io.BytesIO(data), file_type)
+            results = analyze_text(text)
+            results["job_fits"] = JobMatcher.rank_jobs(text, results["skills"], jobs)
+        return results
+
+
+def stored_profiles(store_dir: str = PROFILE_DIR) -> List[Dict]:
+    """Metadata of stored profiles, slowest first."""
+    metas = []
+    for path in Path(store_dir).glob("profile_*.json"):
+        try:
+            meta = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        if path.with_suffix(".prof").exists():
+            meta["path"] = str(path.with_suffix(".prof"))
+            metas.append(meta)
+    return sorted(metas, key=lambda m: -m.get("wall_seconds", 0))
+
+
+def summarize(store_dir: str = PROFILE_DIR, top: int = 20, sort: str = "tottime") -> str:
+    """Hot functions aggregated across every stored profile."""
+    metas = stored_profiles(store_dir)
+    if not metas:
+        return f"No profiles in {store_dir}"
+    out = io.StringIO()
+    out.write(f"{len(metas)} profiles in {store_dir}; slowest inputs:\n")
+    for meta in metas[:5]:
+        fp = meta["input"]
+        out.write(f"  {meta['wall_seconds']:8.3f}s  {meta['label']:<10} {fp['sha256'][:12]}  "
+                  f"{fp['bytes']} bytes  type={fp['file_type']}  lines={fp['lines']}\n")
+    out.write("\n")
+    stats = pstats.Stats(*[m["path"] for m in metas], stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return out.getvalue()
+
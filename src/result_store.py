@@ -0,0 +1,282 @@
+"""
+Persistent Analysis Result Store - SQLite + Parquet export
+Every analysis is keyed by the SHA-256 of the resume text
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.constants import RESULT_STORE_PATH
+from .dashboard_aggregates import DashboardAggregates
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    content_hash TEXT PRIMARY KEY,
+    file_name TEXT,
+    created_at REAL NOT NULL,
+    skill_count INTEGER NOT NULL DEFAULT 0,
+    years_experience INTEGER NOT NULL DEFAULT 0,
+    quality_score REAL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analysis_skills (
+    content_hash TEXT NOT NULL REFERENCES analyses(content_hash) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (content_hash, skill)
+);
+CREATE TABLE IF NOT EXISTS job_fits (
+    content_hash TEXT NOT NULL REFERENCES analyses(content_hash) ON DELETE CASCADE,
+    job_title TEXT NOT NULL,
+    fit_score REAL NOT NULL,
+    PRIMARY KEY (content_hash, job_title)
+);
+CREATE INDEX IF NOT EXISTS idx_skills_skill ON analysis_skills(skill);
+CREATE INDEX IF NOT EXISTS idx_fits_job_score ON job_fits(job_title, fit_score);
+CREATE INDEX IF NOT EXISTS idx_analyses_quality ON analyses(quality_score);
+CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses(created_at);
+"""
+
+# Parquet export: query and column types per table
+EXPORTS = {
+    "analyses": (
+        "SELECT content_hash, file_name, created_at, skill_count, "
+        "years_experience, quality_score FROM analyses",
+        pa.schema([("content_hash", pa.string()), ("file_name", pa.string()),
+                   ("created_at", pa.float64()), ("skill_count", pa.int64()),
+                   ("years_experience", pa.int64()), ("quality_score", pa.float64())]),
+    ),
+    "analysis_skills": (
+        "SELECT content_hash, skill FROM analysis_skills",
+        pa.schema([("content_hash", pa.string()), ("skill", pa.string())]),
+    ),
+    "job_fits": (
+        "SELECT content_hash, job_title, fit_score FROM job_fits",
+        pa.schema([("content_hash", pa.string()), ("job_title", pa.string()),
+                   ("fit_score", pa.float64())]),
+    ),
+}
+
+
+class ResultStore:
+    """SQLite-backed store for analysis results with indexed lookups."""
+
+    def __init__(self, db_path: str = RESULT_STORE_PATH, batch_size: int = 1000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Streamlit reruns the script on different threads; one lock serializes
+        # every use of the shared connection so transactions never interleave
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._aggregates = DashboardAggregates.load(self.conn)
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @property
+    def aggregates(self) -> DashboardAggregates:
+        """Dashboard aggregates, reloaded if another connection committed since."""
+        with self._lock:
+            version = self._read_data_version()
+            if version != self._data_version:
+                self._aggregates = DashboardAggregates.read(self.conn) or self._aggregates
+                self._data_version = version
+            return self._aggregates
+
+    @staticmethod
+    def content_hash(resume_text: str) -> str:
+        """Stable key for a resume's content."""
+        return hashlib.sha256(resume_text.encode("utf-8", errors="ignore")).hexdigest()
+
+    @staticmethod
+    def _rows(resume_text: str, results: Dict, job_fits: Optional[List[Dict]], file_name: Optional[str]):
+        """Flatten one analysis into rows for the three tables."""
+        key = ResultStore.content_hash(resume_text)
+        skills = (results.get("skills") or {}).get("Technical Skills", [])
+        analysis_row = (
+            key,
+            file_name,
+            time.time(),
+            int(results.get("skill_count", len(skills))),
+            int(results.get("years_experience") or 0),
+            results.get("quality_score"),
+            json.dumps(results, default=str),
+        )
+        skill_rows = [(key, s.lower()) for s in dict.fromkeys(skills)]
+        fit_rows = [(key, j["job_title"], float(j["fit_score"])) for j in (job_fits or [])]
+        return key, analysis_row, skill_rows, fit_rows
+
+    def _write(self, batch) -> None:
+        """Write a batch of flattened analyses inside one transaction.
+
+        The aggregates are updated on a fresh copy of the stored snapshot,
+        read under SQLite's write lock so writers in other processes are
+        never overwritten; the copy replaces the in-memory one after commit.
+        Rows already stored under a batch key are swapped out of the
+        aggregates along with the tables.
+        """
+        # A hash repeated within the batch keeps its last analysis, as in the tables
+        batch = list({row[0]: row for row in batch}.values())
+        keys = [(row[0],) for row in batch]
+        with self._lock:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                old_rows = self._stored_rows([row[0] for row in batch])
+                updated = DashboardAggregates.read(self.conn) or DashboardAggregates.rebuild(self.conn)
+                # Replacing an analysis replaces its child rows too
+                self.conn.executemany("DELETE FROM analysis_skills WHERE content_hash = ?", keys)
+                self.conn.executemany("DELETE FROM job_fits WHERE content_hash = ?", keys)
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [row[1] for row in batch],
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO analysis_skills VALUES (?, ?)",
+                    [s for row in batch for s in row[2]],
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO job_fits VALUES (?, ?, ?)",
+                    [f for row in batch for f in row[3]],
+                )
+                updated.replace_rows(old_rows, batch)
+                updated.save(self.conn)
+            self._aggregates = updated
+            self._data_version = self._read_data_version()
+
+    def _stored_rows(self, keys: List[str], chunk: int = 500):
+        """Currently stored rows for keys, flattened like ``_rows`` (payload omitted)."""
+        rows = {}
+        for start in range(0, len(keys), chunk):
+            part = keys[start:start + chunk]
+            marks = ",".join("?" * len(part))
+            for key, file_name, created_at, skill_count, years, quality in self.conn.execute(
+                "SELECT content_hash, file_name, created_at, skill_count, years_experience, quality_score "
+                f"FROM analyses WHERE content_hash IN ({marks})", part
+            ):
+                rows[key] = (key, (key, file_name, created_at, skill_count, years, quality, None), [], [])
+            for key, skill in self.conn.execute(
+                f"SELECT content_hash, skill FROM analysis_skills WHERE content_hash IN ({marks})", part
+            ):
+                if key in rows:
+                    rows[key][2].append((key, skill))
+            for key, title, score in self.conn.execute(
+                f"SELECT content_hash, job_title, fit_score FROM job_fits WHERE content_hash IN ({marks})", part
+            ):
+                if key in rows:
+                    rows[key][3].append((key, title, score))
+        return list(rows.values())
+
+    def record(self, resume_text: str, results: Dict,
+               job_fits: Optional[List[Dict]] = None, file_name: Optional[str] = None) -> str:
+        """Store one analysis and return its content hash."""
+        row = self._rows(resume_text, results, job_fits, file_name)
+        self._write([row])
+        return row[0]
+
+    def record_many(self, items: Iterable[Dict]) -> int:
+        """Bulk insert analyses in batched transactions.
+
+        Each item is a dict with ``resume_text``, ``results`` and optional
+        ``job_fits`` / ``file_name`` keys.
+        """
+        batch = []
+        total = 0
+        for item in items:
+            batch.append(self._rows(
+                item["resume_text"], item["results"],
+                item.get("job_fits"), item.get("file_name"),
+            ))
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+            total += len(batch)
+        return total
+
+    def get(self, content_hash: str) -> Optional[Dict]:
+        """Fetch a stored analysis payload by content hash."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT payload FROM analyses WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by_skill(self, skill: str, limit: int = 100) -> List[str]:
+        """Content hashes of analyses that list a skill."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT content_hash FROM analysis_skills WHERE skill = ? LIMIT ?",
+                (skill.lower(), limit),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def top_for_job(self, job_title: str, limit: int = 10, min_score: float = 0.0) -> List[Dict]:
+        """Best-fitting analyses for a job title."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT content_hash, fit_score FROM job_fits "
+                "WHERE job_title = ? AND fit_score >= ? ORDER BY fit_score DESC LIMIT ?",
+                (job_title, min_score, limit),
+            ).fetchall()
+        return [{"content_hash": h, "fit_score": s} for h, s in rows]
+
+    def by_quality(self, min_score: float = 0.0, max_score: float = 100.0, limit: int = 100) -> List[Dict]:
+        """Analyses whose quality score falls in a range."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT content_hash, file_name, quality_score FROM analyses "
+                "WHERE quality_score BETWEEN ? AND ? ORDER BY quality_score DESC LIMIT ?",
+                (min_score, max_score, limit),
+            ).fetchall()
+        return [{"content_hash": h, "file_name": f, "quality_score": q} for h, f, q in rows]
+
+    def count(self) -> int:
+        """Number of stored analyses."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def export_parquet(self, out_dir: str, chunksize: int = 100_000) -> Dict[str, str]:
+        """Export each table to a Parquet file for columnar analytics.
+
+        Rows are fetched ``chunksize`` at a time and each chunk is written as
+        its own row group, so memory stays bounded by one chunk.
+        """
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        paths = {}
+        with self._lock:
+            for table, (query, schema) in EXPORTS.items():
+                path = out / f"{table}.parquet"
+                cursor = self.conn.execute(query)
+                with pq.ParquetWriter(path, schema) as writer:
+                    while True:
+                        rows = cursor.fetchmany(chunksize)
+                        if not rows:
+                            break
+                        columns = list(zip(*rows))
+                        writer.write_batch(pa.record_batch(
+                            [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+                            schema=schema,
+                        ))
+                paths[table] = str(path)
+        return paths
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
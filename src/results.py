@@ -0,0 +1,164 @@
+"""
+Compact Result Objects - slotted classes, interned term ids, NumPy score vectors
+Batch runs keep one small object per resume; dicts are only built for the UI top-N
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .fuzzy_matcher import tokenize
+from .job_matcher import JobMatcher
+
+
+class Vocabulary:
+    """Interns lowercased skill/keyword strings to dense int ids."""
+
+    __slots__ = ("ids", "terms")
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self.ids: Dict[str, int] = {}
+        self.terms: List[str] = []
+        for term in terms:
+            self.add(term)
+
+    def add(self, term: str) -> int:
+        key = term.lower()
+        term_id = self.ids.get(key)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.ids[key] = term_id
+            self.terms.append(key)
+        return term_id
+
+    def encode(self, terms: Iterable[str], add: bool = False) -> np.ndarray:
+        """Sorted unique ids for terms; unknown terms are skipped unless ``add``."""
+        if add:
+            ids = [self.add(t) for t in terms]
+        else:
+            ids = [i for i in (self.ids.get(t.lower()) for t in terms) if i is not None]
+        return np.unique(np.asarray(ids, dtype=np.int32))
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+
+class SkillSet:
+    """A resume's skills as sorted interned ids."""
+
+    __slots__ = ("ids", "count")
+
+    def __init__(self, ids: np.ndarray, count: int):
+        self.ids = ids
+        self.count = count
+
+    @classmethod
+    def from_skills_dict(cls, skills_dict: dict, count: int, vocab: Vocabulary) -> "SkillSet":
+        return cls(vocab.encode(JobMatcher.resume_skill_list(skills_dict), add=True), count)
+
+    def names(self, vocab: Vocabulary) -> List[str]:
+        return [vocab.terms[i] for i in self.ids]
+
+
+class CompactCatalog:
+    """Job catalog as CSR keyword-id arrays for vectorized scoring.
+
+    Keyword order and duplicates within a job are kept so scores match
+    JobMatcher.rank_jobs exactly.
+    """
+
+    __slots__ = ("titles", "keywords", "vocab", "indptr", "indices", "entry_jobs", "sizes",
+                 "all_keywords", "unique_jobs", "unique_indices")
+
+    def __init__(self, jobs: List[Dict], vocab: Optional[Vocabulary] = None):
+        self.vocab = vocab or Vocabulary()
+        self.titles = [job.get("title", "") for job in jobs]
+        self.keywords = [list(job.get("keywords", [])) for job in jobs]
+        self.sizes = np.array([len(k) for k in self.keywords], dtype=np.int32)
+        self.indptr = np.concatenate([[0], np.cumsum(self.sizes)]).astype(np.int64)
+        self.indices = np.array(
+            [self.vocab.add(k) for kws in self.keywords for k in kws], dtype=np.int32
+        )
+        self.entry_jobs = np.repeat(np.arange(len(jobs), dtype=np.int32), self.sizes)
+        self.all_keywords = JobMatcher.catalog_keywords(jobs)
+        # Distinct (job, keyword) pairs, for counting skills once per job
+        pairs = np.unique(np.stack([self.entry_jobs, self.indices], axis=1), axis=0)
+        self.unique_jobs = pairs[:, 0]
+        self.unique_indices = pairs[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def rank(self, resume_text: str, skills: SkillSet) -> "JobScores":
+        """Score every job for one resume without building per-job dicts."""
+        resume_skills = skills.names(self.vocab)
+        found = JobMatcher.matched_terms(tokenize(resume_text), resume_skills, self.all_keywords)
+        found_ids = self.vocab.encode(found)
+
+        matched = np.isin(self.indices, found_ids)
+        matched_count = np.bincount(self.entry_jobs, weights=matched, minlength=len(self))
+        keyword_match = matched_count / np.maximum(self.sizes, 1) * 100
+
+        # Each resume skill counts once per job it appears in, as in rank_jobs
+        skill_hits = np.bincount(
+            self.unique_jobs, weights=np.isin(self.unique_indices, skills.ids), minlength=len(self)
+        )
+        skills_match = skill_hits / max(len(skills.ids), 1) * 100
+
+        fit = keyword_match * 0.6 + skills_match * 0.4
+        return JobScores(
+            np.round(fit, 1).astype(np.float32),
+            np.round(keyword_match, 1).astype(np.float32),
+            matched_count.astype(np.int16),
+            found_ids,
+        )
+
+
+class JobScores:
+    """Per-job score vectors for one resume against a CompactCatalog."""
+
+    __slots__ = ("fit", "keyword_match", "matched_count", "found_ids")
+
+    def __init__(self, fit: np.ndarray, keyword_match: np.ndarray,
+                 matched_count: np.ndarray, found_ids: np.ndarray):
+        self.fit = fit
+        self.keyword_match = keyword_match
+        self.matched_count = matched_count
+        self.found_ids = found_ids
+
+    def top_indices(self, n: int) -> np.ndarray:
+        """Job indices of the n best fits, ties kept in catalog order."""
+        return np.argsort(-self.fit, kind="stable")[:n]
+
+    def top(self, catalog: CompactCatalog, n: int = 6) -> List[Dict]:
+        """Materialize rank_jobs-style dicts for the n best jobs only."""
+        found = {catalog.vocab.terms[i] for i in self.found_ids}
+        out = []
+        for j in self.top_indices(n):
+            keywords = catalog.keywords[j]
+            matched = [k for k in keywords if k.lower() in found]
+            missing = [k for k in keywords if k.lower() not in found]
+            out.append({
+                'job_title': catalog.titles[j],
+                'fit_score': round(float(self.fit[j]), 1),
+                'keyword_match': round(float(self.keyword_match[j]), 1),
+                'matched_keywords': matched[:10],
+                'missing_keywords': missing[:8],
+                'matched_count': int(self.matched_count[j]),
+                'keywords_count': len(keywords),
+            })
+        return out
+
+
+class AnalysisResult:
+    """One resume's batch analysis: skills, experience, quality and job scores."""
+
+    __slots__ = ("content_hash", "skills", "years_experience", "quality_score", "scores")
+
+    def __init__(self, content_hash: str, skills: SkillSet, years_experience: int,
+                 quality_score: float, scores: Optional[JobScores] = None):
+        self.content_hash = content_hash
+        self.skills = skills
+        self.years_experience = years_experience
+        self.quality_score = quality_score
+        self.scores = scores
@@ -0,0 +1,231 @@
+"""
+Sharded Job Index - scatter-gather ranking across shard servers
+Each shard serves a slice of the catalog over a local socket; the coordinator
+fans out one tokenized resume, gathers per-shard top-k and merges with a heap
+"""
+
+import hashlib
+import heapq
+import itertools
+import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Client, Listener
+from typing import Dict, List, Optional, Tuple
+
+from .fuzzy_matcher import FuzzyMatcher, tokenize
+from .job_matcher import JobMatcher
+
+
+def split_jobs(jobs: List[Dict], n_shards: int, strategy: str = "hash") -> List[List[Dict]]:
+    """Partition a catalog into shards by job-id hash or contiguous id range.
+
+    Jobs without an ``id`` use their catalog position; the id is copied onto
+    each job as ``job_id`` so merged results stay traceable.
+    """
+    shards: List[List[Dict]] = [[] for _ in range(n_shards)]
+    per_range = -(-len(jobs) // n_shards) if jobs else 1
+    for position, job in enumerate(jobs):
+        job_id = job.get("id", position)
+        if strategy == "hash":
+            digest = hashlib.blake2b(str(job_id).encode("utf-8"), digest_size=8).digest()
+            index = int.from_bytes(digest, "big") % n_shards
+        elif strategy == "range":
+            index = position // per_range
+        else:
+            raise ValueError(f"Unknown shard strategy: {strategy}")
+        shards[index].append({**job, "job_id": job_id})
+    return shards
+
+
+class JobShard:
+    """One slice of the catalog with its own keyword index."""
+
+    def __init__(self, shard_id: int, jobs: List[Dict]):
+        self.shard_id = shard_id
+        self.jobs = jobs
+        self.keywords = JobMatcher.catalog_keywords(jobs)
+        # Owned per shard (as in CatalogSnapshot) so many in-process shards do
+        # not contend for JobMatcher's small shared matcher cache
+        self.matcher = FuzzyMatcher({k: k for k in self.keywords})
+
+    def top_k(self, tokens: List[str], resume_skills: List[str], k: int) -> List[Dict]:
+        """Best k jobs in this shard, highest fit first."""
+        found = set(self.matcher.find_tokens(tokens)) | set(resume_skills)
+        scored = []
+        for job in self.jobs:
+            result = JobMatcher.score_job(job, found, resume_skills)
+            result["job_id"] = job["job_id"]
+            result["shard"] = self.shard_id
+            scored.append(result)
+        return heapq.nlargest(k, scored, key=lambda r: r["fit_score"])
+
+
+def _serve_shard(shard_id: int, jobs: List[Dict], address_pipe, authkey: bytes) -> None:
+    """Shard server loop: one connection from the coordinator, one request at a time."""
+    shard = JobShard(shard_id, jobs)
+    with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+        address_pipe.send(listener.address)
+        address_pipe.close()
+        with listener.accept() as conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    break
+                if message is None:
+                    break
+                request_id, tokens, resume_skills, k = message
+                started = time.perf_counter()
+                results = shard.top_k(tokens, resume_skills, k)
+                conn.send((request_id, results, time.perf_counter() - started))
+
+
+class _RemoteShard:
+    """Coordinator-side handle for one shard server."""
+
+    def __init__(self, shard_id: int, address, authkey: bytes, process=None):
+        self.shard_id = shard_id
+        self.conn = Client(address, authkey=authkey)
+        self.process = process
+        self.lock = threading.Lock()
+
+    def query(self, request_id: int, tokens, resume_skills, k: int, timeout: float):
+        """Send one request and wait for its reply, skipping stale late replies."""
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            self.conn.send((request_id, tokens, resume_skills, k))
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.conn.poll(remaining):
+                    raise TimeoutError(f"shard {self.shard_id} timed out")
+                reply_id, results, compute_seconds = self.conn.recv()
+                if reply_id == request_id:
+                    return results, compute_seconds
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process is not None:
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.terminate()
+
+
+class _LocalShard:
+    """In-process shard with the same interface, for tests and small catalogs."""
+
+    def __init__(self, shard: JobShard):
+        self.shard_id = shard.shard_id
+        self.shard = shard
+
+    def query(self, request_id: int, tokens, resume_skills, k: int, timeout: float):
+        started = time.perf_counter()
+        return self.shard.top_k(tokens, resume_skills, k), time.perf_counter() - started
+
+    def close(self) -> None:
+        pass
+
+
+class ShardedJobIndex:
+    """Scatter-gather coordinator over N job catalog shards.
+
+    ``min_shards`` sets the partial-results policy: a query succeeds if at
+    least that many shards answer within ``timeout`` seconds, otherwise it
+    raises TimeoutError. The default requires every shard.
+    """
+
+    def __init__(self, jobs: List[Dict], n_shards: int = 4, strategy: str = "hash",
+                 use_processes: bool = True, timeout: float = 2.0,
+                 min_shards: Optional[int] = None):
+        self.n_shards = n_shards
+        self.timeout = timeout
+        self.min_shards = n_shards if min_shards is None else min_shards
+        self._request_ids = itertools.count()
+        self._pool = ThreadPoolExecutor(max_workers=n_shards)
+        parts = split_jobs(jobs, n_shards, strategy)
+
+        if not use_processes:
+            self.shards = [_LocalShard(JobShard(i, part)) for i, part in enumerate(parts)]
+            return
+
+        authkey = mp.current_process().authkey
+        pending = []
+        for i, part in enumerate(parts):
+            parent_end, child_end = mp.Pipe(duplex=False)
+            process = mp.Process(
+                target=_serve_shard, args=(i, part, child_end, authkey),
+                name=f"job-shard-{i}", daemon=True,
+            )
+            process.start()
+            child_end.close()
+            pending.append((i, parent_end, process))
+        self.shards = [
+            _RemoteShard(i, pipe.recv(), authkey, process) for i, pipe, process in pending
+        ]
+
+    def rank(self, resume_text: str, skills_dict: dict, k: int = 10) -> Dict:
+        """Top-k jobs across all shards plus per-shard timing."""
+        request_id = next(self._request_ids)
+        tokens = tokenize(resume_text)
+        resume_skills = JobMatcher.resume_skill_list(skills_dict)
+        started = time.perf_counter()
+
+        futures = {
+            shard.shard_id: self._pool.submit(
+                self._timed_query, shard, started, request_id, tokens, resume_skills, k)
+            for shard in self.shards
+        }
+        partials: List[List[Dict]] = []
+        timings: Dict[int, Dict] = {}
+        failed: List[int] = []
+        for shard_id, future in futures.items():
+            try:
+                results, compute_seconds, round_trip_seconds = future.result()
+            except Exception as e:
+                failed.append(shard_id)
+                # str() of EOFError and friends is empty; keep the type visible
+                timings[shard_id] = {"error": f"{type(e).__name__}: {e}" if str(e) else type(e).__name__}
+                continue
+            partials.append(results)
+            timings[shard_id] = {
+                "compute_ms": round(compute_seconds * 1000, 2),
+                "round_trip_ms": round(round_trip_seconds * 1000, 2),
+                "results": len(results),
+            }
+
+        if len(partials) < self.min_shards:
+            raise TimeoutError(
+                f"only {len(partials)}/{self.n_shards} shards answered (need {self.min_shards})"
+            )
+
+        # Each shard list is sorted by fit, so a k-way heap merge yields the global order
+        merged = heapq.merge(*partials, key=lambda r: -r["fit_score"])
+        return {
+            "jobs": list(itertools.islice(merged, k)),
+            "partial": bool(failed),
+            "failed_shards": failed,
+            "shard_timings": timings,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _timed_query(self, shard, started: float, request_id: int, tokens, resume_skills, k: int):
+        """Query one shard; round trip is measured from the coordinator's fan-out,
+        so it includes pool queueing and transport on top of shard compute."""
+        results, compute_seconds = shard.query(request_id, tokens, resume_skills, k, self.timeout)
+        return results, compute_seconds, time.perf_counter() - started
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+        self._pool.shutdown()
+
+    def __enter__(self) -> "ShardedJobIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
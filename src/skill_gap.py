@@ -0,0 +1,158 @@
+"""
+Skill Gap Analytics - catalog-wide counters over batched match results
+Counters share the CSR layout of the job x keyword matrix, so every update
+and query is a vectorized pass over its non-zeros
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from .fuzzy_matcher import tokenize
+from .job_matcher import JobMatcher
+
+
+class SkillGapAnalytics:
+    """Incrementally updated job x missing-keyword and skill x unlocked-job counts.
+
+    A skill "unlocks" a job for a candidate when adding it lifts the
+    candidate's keyword coverage of that job from below ``threshold`` to at
+    least ``threshold``.
+    """
+
+    def __init__(self, jobs: List[Dict], threshold: float = 0.6):
+        self.threshold = threshold
+        self.job_titles = [job.get("title", "") for job in jobs]
+        self.title_jobs: Dict[str, List[int]] = {}
+        for j, title in enumerate(self.job_titles):
+            self.title_jobs.setdefault(title.lower(), []).append(j)
+        self.keywords = sorted({k.lower() for job in jobs for k in job.get("keywords", [])})
+        self.keyword_index = {k: i for i, k in enumerate(self.keywords)}
+
+        rows, cols = [], []
+        for j, job in enumerate(jobs):
+            for k in {k.lower() for k in job.get("keywords", [])}:
+                rows.append(j)
+                cols.append(self.keyword_index[k])
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(jobs), len(self.keywords)),
+        )
+        self.matrix.sort_indices()
+        # Job row of each stored entry, aligned with matrix.indices
+        self.entry_jobs = np.repeat(np.arange(len(jobs)), np.diff(self.matrix.indptr))
+        self.job_sizes = np.diff(self.matrix.indptr).astype(np.float32)
+        # Keyword count a job needs to reach the threshold
+        self.needed = np.ceil(self.threshold * self.job_sizes - 1e-9)
+
+        self.missing_counts = np.zeros(self.matrix.nnz, dtype=np.int64)
+        self.unlock_counts = np.zeros(self.matrix.nnz, dtype=np.int64)
+        self.candidates = 0
+
+    def encode(self, keyword_sets: Iterable[Iterable[str]]) -> sparse.csr_matrix:
+        """Binary candidate x keyword matrix; unknown keywords are ignored."""
+        rows, cols = [], []
+        n = 0
+        for n_row, keywords in enumerate(keyword_sets):
+            n = n_row + 1
+            for k in {k.lower() for k in keywords}:
+                col = self.keyword_index.get(k)
+                if col is not None:
+                    rows.append(n_row)
+                    cols.append(col)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(n, len(self.keywords)),
+        )
+
+    def _entry_flags(self, candidates: sparse.csr_matrix):
+        """Per-candidate missing and unlock flags for every stored entry."""
+        have = candidates.toarray().astype(bool)
+        covered = np.asarray((candidates @ self.matrix.T).todense())
+        missing = ~have[:, self.matrix.indices]
+        job_covered = covered[:, self.entry_jobs]
+        needed = self.needed[self.entry_jobs]
+        unlocks = missing & (job_covered < needed) & (job_covered + 1 >= needed)
+        return missing, unlocks
+
+    def add_candidates(self, keyword_sets: Iterable[Iterable[str]], chunk_size: int = 1024) -> None:
+        """Fold a batch of candidates (their matched keywords) into the counters."""
+        matrix = self.encode(keyword_sets)
+        for start in range(0, matrix.shape[0], chunk_size):
+            missing, unlocks = self._entry_flags(matrix[start:start + chunk_size])
+            self.missing_counts += missing.sum(axis=0)
+            self.unlock_counts += unlocks.sum(axis=0)
+        self.candidates += matrix.shape[0]
+
+    def add_resumes(self, resumes: Iterable[Tuple[str, dict]]) -> None:
+        """Fold ``(resume_text, skills_dict)`` pairs into the counters.
+
+        Uses the full matched keyword set that rank_jobs scores against, not
+        the per-job ``matched_keywords`` lists, which are cut to 10 entries.
+        """
+        keywords = tuple(self.keywords)
+        self.add_candidates(
+            JobMatcher.matched_terms(tokenize(text), JobMatcher.resume_skill_list(skills), keywords)
+            for text, skills in resumes
+        )
+
+    def top_missing_skills(self, job_title: str, n: int = 10) -> List[Dict]:
+        """Most frequently missing keywords across applicants for a role."""
+        jobs = self.title_jobs.get(job_title.lower(), [])
+        if not jobs:
+            return []
+        entries = np.concatenate([
+            np.arange(self.matrix.indptr[j], self.matrix.indptr[j + 1]) for j in jobs
+        ])
+        totals = np.bincount(
+            self.matrix.indices[entries], weights=self.missing_counts[entries],
+            minlength=len(self.keywords),
+        )
+        order = np.argsort(-totals, kind="stable")[:n]
+        return [
+            {"skill": self.keywords[i], "missing_count": int(totals[i]),
+             "missing_rate": round(totals[i] / max(self.candidates * len(jobs), 1), 3)}
+            for i in order if totals[i] > 0
+        ]
+
+    def top_unlocking_skills(self, n: int = 10) -> List[Dict]:
+        """Skills that most often unlock a role across all applicants."""
+        per_skill = np.bincount(
+            self.matrix.indices, weights=self.unlock_counts, minlength=len(self.keywords)
+        )
+        order = np.argsort(-per_skill, kind="stable")[:n]
+        return [
+            {"skill": self.keywords[i], "unlocked_jobs": int(per_skill[i])}
+            for i in order if per_skill[i] > 0
+        ]
+
+    def next_best_skills(self, keywords: Iterable[str], n: int = 5,
+                         exclude: Optional[Set[str]] = None) -> List[Dict]:
+        """Rank missing skills for one candidate by marginal gain.
+
+        Gain is the number of jobs the skill unlocks, with ties broken by the
+        total coverage it adds across the catalog.
+        """
+        candidate = self.encode([keywords])
+        _, unlocks = self._entry_flags(candidate)
+        have = candidate.toarray()[0].astype(bool)
+        unlocked = np.bincount(
+            self.matrix.indices, weights=unlocks[0], minlength=len(self.keywords)
+        )
+        coverage_gain = np.bincount(
+            self.matrix.indices, weights=1.0 / self.job_sizes[self.entry_jobs],
+            minlength=len(self.keywords),
+        )
+        candidates = ~have
+        if exclude:
+            for k in exclude:
+                if k.lower() in self.keyword_index:
+                    candidates[self.keyword_index[k.lower()]] = False
+        order = np.lexsort((-coverage_gain, -unlocked))
+        ranked = [i for i in order if candidates[i]][:n]
+        return [
+            {"skill": self.keywords[i], "unlocked_jobs": int(unlocked[i]),
+             "coverage_gain": round(float(coverage_gain[i]), 3)}
+            for i in ranked
+        ]
@@ -0,0 +1,121 @@
+"""
+Job Title Taxonomy - token trie over a data-file title list
+Matching walks the trie once per token, so cost does not grow with taxonomy size
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "job_titles.json"
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+# Characters allowed between the words of one title ("Full-Stack", "Sr. Dev")
+_GAP_RE = re.compile(r"[\s\-.]*")
+
+_END = "$"
+
+
+class TitleTaxonomy:
+    """Compiled title taxonomy with precomputed level/progression lookups."""
+
+    def __init__(self, entries: Iterable[Dict]):
+        self.trie: Dict = {}
+        self.entries: Dict[str, Dict] = {}
+        self.variants: Dict[str, str] = {}
+        self.max_words = 0
+        for entry in entries:
+            canonical = entry["title"]
+            key = self.normalize(canonical)
+            self.entries[key] = {
+                "title": canonical,
+                "level": entry.get("level"),
+                "progression": entry.get("progression"),
+            }
+            for variant in [canonical] + list(entry.get("aliases", [])):
+                self._insert(variant, key)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_TAXONOMY_PATH) -> "TitleTaxonomy":
+        """Load a taxonomy from a JSON file with a ``titles`` list."""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["titles"])
+
+    @staticmethod
+    def normalize(title: str) -> str:
+        """Lowercase and collapse a title to its token sequence."""
+        return " ".join(_TOKEN_RE.findall(title.lower()))
+
+    def _insert(self, variant: str, key: str) -> None:
+        words = _TOKEN_RE.findall(variant.lower())
+        self.variants[" ".join(words)] = key
+        node = self.trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[_END] = key
+        self.max_words = max(self.max_words, len(words))
+
+    def _match_keys(self, text: str) -> List[str]:
+        """Canonical keys of longest title matches, in order of appearance."""
+        text = text.lower()
+        tokens = [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
+        found = []
+        i = 0
+        while i < len(tokens):
+            node = self.trie
+            best = None
+            best_end = i
+            j = i
+            while j < len(tokens) and j - i < self.max_words:
+                # Words of a title may only be separated by spaces, hyphens or dots
+                if j > i and _GAP_RE.fullmatch(text, tokens[j - 1][2], tokens[j][1]) is None:
+                    break
+                node = node.get(tokens[j][0])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    best, best_end = node[_END], j
+            if best is None:
+                i += 1
+            else:
+                found.append(best)
+                i = best_end
+        return found
+
+    def extract(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Distinct canonical titles found in text, in order of appearance."""
+        titles = [self.entries[k]["title"] for k in dict.fromkeys(self._match_keys(text))]
+        return titles[:limit] if limit else titles
+
+    def extract_batch(self, texts: Iterable[str], limit: Optional[int] = None) -> List[List[str]]:
+        """Extract titles from many texts."""
+        return [self.extract(text, limit) for text in texts]
+
+    def lookup(self, title: str) -> Optional[Dict]:
+        """Taxonomy entry for a title, matching canonical names and aliases."""
+        key = self.variants.get(self.normalize(title))
+        if key is None:
+            keys = self._match_keys(title)
+            key = keys[0] if keys else None
+        return self.entries[key] if key else None
+
+    def level_for(self, title: str) -> Optional[str]:
+        entry = self.lookup(title)
+        return entry["level"] if entry else None
+
+    def progression_for(self, title: str) -> Optional[str]:
+        entry = self.lookup(title)
+        return entry["progression"] if entry else None
+
+
+_default_taxonomy: Optional[TitleTaxonomy] = None
+
+
+def get_taxonomy() -> TitleTaxonomy:
+    """Shared taxonomy loaded once from the default data file."""
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        _default_taxonomy = TitleTaxonomy.from_file()
+    return _default_taxonomy
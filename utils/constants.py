@@ -1,5 +1,7 @@
 """Constants and configuration"""
 
+from pathlib import Path
+
 SKILL_CATEGORIES = {
     "Programming Languages": ["Python", "Java", "JavaScript", "C++", "Go", "Rust", "R", "SQL"],
     "Data Science & AI": ["Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "Scikit-learn", "NLP"],
@@ -8,6 +10,24 @@ SKILL_CATEGORIES = {
     "Databases": ["MySQL", "PostgreSQL", "MongoDB", "Redis", "Elasticsearch"],
 }
 
+# Skills not listed in a category but still extracted from resumes
+EXTRA_SKILLS = ["Git", "GitHub", "Jenkins", "FastAPI", "CI/CD", "Linux", "TypeScript"]
+
+# Alternate spellings mapped to their canonical skill name
+SKILL_ALIASES = {
+    "k8s": "Kubernetes",
+    "nodejs": "Node.js",
+    "sklearn": "Scikit-learn",
+    "scikit learn": "Scikit-learn",
+    "golang": "Go",
+    "postgres": "PostgreSQL",
+    "gcp": "Google Cloud",
+    "ml": "Machine Learning",
+}
+
+# Everyday words that are also skill names; only matched through aliases
+AMBIGUOUS_SKILLS = {"R", "Go"}
+
 SAMPLE_JOBS = [
     {
         "title": "Machine Learning Engineer",
@@ -80,3 +100,13 @@ QUALITY_METRICS = {
     "length": {"min": 150, "max": 1000},
     "keywords_min": 15,
 }
+
+# Data paths resolve from the package so they never depend on the launch directory
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+RESULT_STORE_PATH = str(DATA_DIR / "analysis_results.db")
+PREVIEW_CHARS = 5000
+FUZZY_INDEX_CACHE_DIR = str(DATA_DIR / "cache")
+JOB_CATALOG_PATH = str(DATA_DIR / "job_descriptions.json")
+PROFILE_DIR = str(DATA_DIR / "profiles")
+PROFILE_CAPACITY = 50